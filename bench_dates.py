@@ -0,0 +1,102 @@
+"""
+Microbenchmark for date extraction on recorded card and page texts.
+
+Compares the per-collector regexes the collectors used to carry with the
+shared engine in src/utils/dates.py, and checks both find the same dates.
+
+    python bench_dates.py [iterations]
+"""
+import re
+import sys
+import timeit
+
+from src.utils.dates import AIRED, AVAILABLE_UNTIL, extract_date
+
+# Recorded innerText samples (trimmed) from each provider
+SYNDIO_CARDS = [
+    "WEBINAR\nPay Equity in 2025: What HR Leaders Need to Know\nAired on: March 12, 2025\nWatch now",
+    "WEBINAR\nBuilding a Defensible Pay Strategy\nJoin Syndio's experts for a deep dive into pay transparency laws.\nAired on: November 7, 2024\nWatch now",
+    "WEBINAR\nPay Transparency Roundtable\nAired on: January 30 2024\nWatch now",
+]
+PAVE_CARDS = [
+    "Webinar\nCompensation Planning for 2026\nAired on:\nNovember\n \n20\n, \n2025\nWatch Recording",
+    "Webinar\nEquity Benchmarks: What the Data Says\nAired on:\nSeptember\n \n4\n, \n2025\nWatch Recording",
+    "Event\nPave Summit Recap\nOctober 15, 2025\nLearn more",
+]
+WORLDATWORK_PAGE = (
+    "Skip to main content\nMembership\nCertification\nEvents\nResources\n" * 40
+    + "Total Rewards Trends for 2025\nOn Demand until December 31, 2025\nRegister\n"
+    + "Related content\nFooter\nPrivacy Policy\nTerms of Use\n" * 40
+)
+
+
+def legacy_syndio(text):
+    for line in text.split("\n"):
+        match = re.search(r'Aired on:\s*(\w+\s+\d{1,2},?\s+\d{4})', line)
+        if match:
+            return match.group(1)
+    match = re.search(r'Aired on:\s*(\w+\s+\d{1,2},?\s+\d{4})', text)
+    return match.group(1) if match else None
+
+
+def legacy_pave(text):
+    text_clean = ' '.join(text.split())
+    match = re.search(r'Aired on:\s*(\w+)\s+(\d{1,2})\s*,\s*(\d{4})', text_clean)
+    if not match:
+        match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})\s*,?\s*(\d{4})', text_clean)
+    if match:
+        month, day, year = match.groups()
+        return f"{month} {day}, {year}"
+    return None
+
+
+def legacy_worldatwork(text):
+    match = re.search(r'On Demand until\s+(\w+\s+\d{1,2},?\s+\d{4})', text)
+    return match.group(1) if match else None
+
+
+def run_legacy():
+    for text in SYNDIO_CARDS:
+        legacy_syndio(text)
+    for text in PAVE_CARDS:
+        legacy_pave(text)
+    legacy_worldatwork(WORLDATWORK_PAGE)
+
+
+def run_engine():
+    for text in SYNDIO_CARDS:
+        extract_date(text, AIRED)
+    for text in PAVE_CARDS:
+        extract_date(text, AIRED, fallback=True)
+    extract_date(WORLDATWORK_PAGE, AVAILABLE_UNTIL)
+
+
+def check_agreement():
+    """Both implementations must find a date on the same samples."""
+    pairs = (
+        [(legacy_syndio(t), extract_date(t, AIRED)) for t in SYNDIO_CARDS]
+        + [(legacy_pave(t), extract_date(t, AIRED, fallback=True)) for t in PAVE_CARDS]
+        + [(legacy_worldatwork(WORLDATWORK_PAGE), extract_date(WORLDATWORK_PAGE, AVAILABLE_UNTIL))]
+    )
+    for legacy, engine in pairs:
+        print(f"  {str(legacy):22} -> {engine}")
+        assert (legacy is None) == (engine is None)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    
+    print("Extracted dates (legacy -> engine):")
+    check_agreement()
+    
+    legacy = min(timeit.repeat(run_legacy, number=iterations, repeat=5))
+    engine = min(timeit.repeat(run_engine, number=iterations, repeat=5))
+    
+    print(f"\n{iterations} iterations over {len(SYNDIO_CARDS) + len(PAVE_CARDS) + 1} texts:")
+    print(f"  legacy regexes: {legacy * 1000:8.1f} ms")
+    print(f"  shared engine:  {engine * 1000:8.1f} ms  ({legacy / engine:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Load test for the query service (src/service.py).
+
+Concurrent clients poll a mix of queries, each keeping the ETags it has
+seen and sending If-None-Match like a dashboard would. Reports throughput,
+latency percentiles and the share of 304s.
+
+    python bench_service.py [--url http://127.0.0.1:8000] [--clients 16] [--requests 2000]
+
+Without --url, a server is started in-process on a free port over --db.
+"""
+import argparse
+import http.client
+import random
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+from src.database.db_manager import DatabaseManager
+from src.service import make_server
+
+QUERIES = [
+    "/webinars",
+    "/webinars?limit=20",
+    "/webinars?source=Syndio",
+    "/webinars?source=WorldatWork&from=2025-01-01",
+    "/webinars?source=Pave&to=2025-12-31",
+    "/webinars?q=pay",
+    "/webinars?q=equity&limit=10",
+    "/stats",
+]
+
+
+def client(host: str, port: int, count: int, results: list, lock: threading.Lock):
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    etags = {}
+    local = []
+    for _ in range(count):
+        path = random.choice(QUERIES)
+        headers = {"If-None-Match": etags[path]} if path in etags else {}
+        started = time.perf_counter()
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        local.append((time.perf_counter() - started, response.status))
+        if response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+    conn.close()
+    with lock:
+        results.extend(local)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the query service")
+    parser.add_argument("--url", help="Running service (default: start one in-process)")
+    parser.add_argument("--db", default="data/webinars.db")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests")
+    args = parser.parse_args()
+    
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        server = make_server(DatabaseManager(args.db), port=0)
+        host, port = "127.0.0.1", server.server_port
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    results, lock = [], threading.Lock()
+    per_client = max(1, args.requests // args.clients)
+    threads = [
+        threading.Thread(target=client, args=(host, port, per_client, results, lock))
+        for _ in range(args.clients)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    
+    latencies = sorted(r[0] * 1000 for r in results)
+    statuses = {}
+    for _, status in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+    
+    print(f"{len(results)} requests from {args.clients} clients in {elapsed:.2f}s "
+          f"({len(results) / elapsed:.0f} req/s)")
+    print(f"latency ms: p50 {statistics.median(latencies):.2f}  p95 {pct(0.95):.2f}  "
+          f"p99 {pct(0.99):.2f}  max {latencies[-1]:.2f}")
+    print("status: " + ", ".join(f"{s}: {n}" for s, n in sorted(statuses.items())))
+    if server:
+        cache = server.RequestHandlerClass.service.cache
+        print(f"cache: {cache.hits} hits, {cache.misses} misses")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Content-addressed archive of the raw pages collectors fetch.
+
+Opt-in via PAGE_ARCHIVE_DIR. Each listing and detail page a collector
+extracts from is snapshotted (its rendered HTML) and stored compressed
+under objects/<sha256[:2]>/<sha256>, so identical pages are stored once.
+An SQLite index (index.db) records which URL was fetched when and by which
+collector. The reparse command replays the snapshots through the current
+extractors without touching the network.
+
+Objects are zstd-compressed when the zstandard package is installed and
+gzip-compressed otherwise; the codec is recorded per page.
+
+prune() keeps the newest PAGE_ARCHIVE_KEEP snapshots of each URL (default 3)
+and deletes objects no snapshot refers to any more; collect runs it at the
+end of every run so the archive does not grow without bound.
+"""
+import gzip
+import hashlib
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Page kinds
+LISTING = "listing"
+DETAIL = "detail"
+
+DEFAULT_KEEP = 3
+
+
+class ArchivedPage(NamedTuple):
+    source: str
+    kind: str
+    url: str
+    fetched_at: str
+    sha256: str
+    codec: str
+
+
+def _compress(data: bytes) -> tuple[str, bytes]:
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=10).compress(data)
+    return "gzip", gzip.compress(data, compresslevel=6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("This archive uses zstd: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class PageArchive:
+    """Compressed, deduplicated page snapshots with an index by URL and fetch time."""
+    
+    def __init__(self, root: str = "data/archive"):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.db"
+        with sqlite3.connect(self.index_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    codec TEXT NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_url ON pages(source, url, fetched_at)")
+            conn.commit()
+    
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects / sha256[:2] / sha256
+    
+    def put(self, source: str, kind: str, url: str, content: str) -> str:
+        """Store a page snapshot and index it. Returns its content hash."""
+        data = content.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha256)
+        
+        with sqlite3.connect(self.index_path) as conn:
+            row = conn.execute("SELECT codec FROM pages WHERE sha256 = ? LIMIT 1", (sha256,)).fetchone()
+            if row and path.exists():
+                codec = row[0]
+            else:
+                codec, blob = _compress(data)
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(blob)
+                tmp.replace(path)
+            conn.execute("""
+                INSERT INTO pages (source, kind, url, fetched_at, sha256, codec, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (source, kind, url, datetime.utcnow().isoformat(), sha256, codec, len(data)))
+            conn.commit()
+        return sha256
+    
+    def read(self, page: ArchivedPage) -> str:
+        """Get the HTML of an archived page."""
+        blob = self._object_path(page.sha256).read_bytes()
+        return _decompress(page.codec, blob).decode("utf-8")
+    
+    def latest(self, source: Optional[str] = None) -> List[ArchivedPage]:
+        """Get the most recent snapshot of every archived URL, oldest first."""
+        query = """
+            SELECT source, kind, url, fetched_at, sha256, codec FROM pages
+            WHERE id IN (SELECT MAX(id) FROM pages GROUP BY source, kind, url)
+        """
+        params: tuple = ()
+        if source:
+            query += " AND source = ?"
+            params = (source,)
+        query += " ORDER BY id"
+        with sqlite3.connect(self.index_path) as conn:
+            return [ArchivedPage(*row) for row in conn.execute(query, params)]
+    
+    def prune(self, keep: int = DEFAULT_KEEP) -> Tuple[int, int]:
+        """
+        Drop all but the newest keep snapshots of each URL, then delete unreferenced objects.
+        
+        Returns (snapshots dropped, objects deleted).
+        """
+        with sqlite3.connect(self.index_path) as conn:
+            cursor = conn.execute("""
+                DELETE FROM pages WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY source, kind, url ORDER BY id DESC
+                        ) AS n FROM pages
+                    ) WHERE n > ?
+                )
+            """, (max(1, keep),))
+            dropped = cursor.rowcount
+            conn.commit()
+            referenced = {row[0] for row in conn.execute("SELECT DISTINCT sha256 FROM pages")}
+        
+        deleted = 0
+        for path in self.objects.glob("*/*"):
+            # Leftover .tmp files from an interrupted put() go too
+            if path.name not in referenced:
+                try:
+                    path.unlink()
+                    deleted += 1
+                except OSError:
+                    continue
+        return dropped, deleted
+
+
+def get_keep() -> int:
+    """Snapshots kept per URL (PAGE_ARCHIVE_KEEP, default 3)."""
+    return int(os.environ.get("PAGE_ARCHIVE_KEEP", DEFAULT_KEEP))
+
+
+def get_archive() -> Optional[PageArchive]:
+    """Get the archive configured by PAGE_ARCHIVE_DIR, or None if archiving is off."""
+    root = os.environ.get("PAGE_ARCHIVE_DIR")
+    return PageArchive(root) if root else None
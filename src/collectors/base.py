@@ -1,43 +1,312 @@
 """
 Base collector using Playwright for JavaScript-rendered pages.
+
+Collectors yield records; run() hands them on in batches with a resumable
+checkpoint, within a time budget. See run(), goto(), capture() and
+archive_page() for the details.
 """
+import time
 from abc import ABC, abstractmethod
-from typing import List
-from playwright.sync_api import sync_playwright, Page, Browser
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+from pathlib import Path
+from playwright.sync_api import sync_playwright, Page, BrowserContext
 import logging
+from ..database.models import WebinarRecord
+from .capture import PayloadFields, PayloadItem, ResponseCapture
+from .strategies import StrategyCache
+from ..archive import LISTING, get_archive
+from ..utils.browser_profile import chromium_args, enforce_size_cap, get_profile_dir
+from ..utils.politeness import get_scheduler
+from ..utils.retry import CircuitOpen, FetchError, backoff_delay, is_transient
+
+# on_batch(records, state) - state is None once the run has completed
+BatchCallback = Callable[[List[WebinarRecord], Optional[dict]], None]
+
+
+class BudgetExceeded(Exception):
+    """Raised when a collector runs out of its time budget."""
 
 
 class BaseCollector(ABC):
     """Abstract base class for Playwright-based collectors."""
     
     SOURCE_NAME: str = "Unknown"
+    BATCH_SIZE: int = 10
+    TIME_BUDGET: float = 600.0  # seconds
+    DEFAULT_TIMEOUT_MS: float = 30000
+    MAX_ATTEMPTS: int = 3
+    RETRY_BASE_DELAY: float = 2.0  # seconds
+    # Regexes for API URLs whose JSON responses hold listing data
+    CAPTURE_PATTERNS: tuple = ()
+    PAYLOAD_FIELDS: Optional[PayloadFields] = None
+    # Sitemaps to check before crawling (besides robots.txt's) and the webinar URLs in them
+    SITEMAP_URLS: tuple = ()
+    SITEMAP_PATTERN: Optional[str] = None
+    # Run on every shard and split per-item work by URL (see sharding.py)
+    SHARD_BY_ITEM: bool = False
+    # air_date is an "available until" date; rows are archived once it passes
+    AIR_DATE_IS_EXPIRY: bool = False
     
     def __init__(self):
         self.logger = logging.getLogger(f"collector.{self.SOURCE_NAME.lower()}")
-        self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)-8s | %(message)s"))
-            self.logger.addHandler(handler)
+        self.scheduler = get_scheduler()
+        self.state: dict = {}
+        self._on_batch: Optional[BatchCallback] = None
+        self._pending: List[WebinarRecord] = []
+        self.deadline: Optional[float] = None
+        self.elapsed = 0.0
+        self.over_budget = False
+        self.completed = False
+        # Webinars on the provider's listings this run, new or not (the crawl's yield)
+        self.listed = 0
+        # url -> error for navigations that failed transiently (retry next run)
+        self.failed: Dict[str, str] = {}
+        self.fetched: Set[str] = set()
+        self.archive = get_archive()
+        self.shard = None
+        self.trace_path: Optional[Path] = None
+        self.strategies = StrategyCache()
+    
+    def owns(self, key: str) -> bool:
+        """Whether this run is responsible for key (always, unless sharded)."""
+        return self.shard is None or self.shard.owns(key)
+    
+    def remaining(self) -> float:
+        """Seconds left in this run's budget."""
+        if self.deadline is None:
+            return float("inf")
+        return self.deadline - time.monotonic()
+    
+    def check_budget(self):
+        """Raise BudgetExceeded if the budget is used up."""
+        if self.remaining() <= 0:
+            raise BudgetExceeded(f"{self.SOURCE_NAME} exceeded its time budget")
+    
+    def clamp_timeout(self, timeout_ms: float) -> float:
+        """Limit a Playwright timeout (ms) to the time left in the budget."""
+        return max(1.0, min(timeout_ms, self.remaining() * 1000))
+    
+    def goto(self, page: Page, url: str, **kwargs):
+        """
+        Navigate through the shared per-host politeness scheduler, within the budget.
+        
+        Transient failures (timeouts, dropped connections, 429/5xx) are retried
+        up to MAX_ATTEMPTS times with jittered backoff, as long as the wait
+        fits in the budget; 404s are not. Error statuses raise FetchError; an
+        open circuit raises CircuitOpen without navigating. URLs that still
+        fail transiently are listed in ``failed`` for the next run's retry queue.
+        """
+        timeout = kwargs.pop("timeout", self.DEFAULT_TIMEOUT_MS)
+        for attempt in range(self.MAX_ATTEMPTS):
+            self.check_budget()
+            try:
+                response = self.scheduler.goto(page, url, timeout=self.clamp_timeout(timeout), **kwargs)
+                if response is not None and response.status >= 400:
+                    raise FetchError(url, response.status)
+            except Exception as e:
+                if is_transient(e) or isinstance(e, CircuitOpen):
+                    self.failed[url] = str(e).splitlines()[0][:200]
+                else:
+                    self.failed.pop(url, None)
+                delay = backoff_delay(attempt, self.RETRY_BASE_DELAY)
+                if (not is_transient(e) or attempt + 1 >= self.MAX_ATTEMPTS
+                        or delay >= self.remaining()):
+                    raise
+                self.logger.warning(f"Retrying {url} in {delay:.1f}s after: {self.failed[url]}")
+                time.sleep(delay)
+                continue
+            self.failed.pop(url, None)
+            self.fetched.add(url)
+            return response
+    
+    @contextmanager
+    def capture(self, page: Page) -> Iterator[ResponseCapture]:
+        """
+        Capture matching JSON responses while the block loads the listing.
+        
+        Collectors whose listings load from an API set CAPTURE_PATTERNS and
+        PAYLOAD_FIELDS, read records from the captured JSON with
+        payload_items() (see capture.py) and scrape the rendered DOM only for
+        what the payloads did not cover.
+        """
+        captured = ResponseCapture(page, self.CAPTURE_PATTERNS)
+        try:
+            yield captured
+        finally:
+            captured.stop()
+    
+    def payload_items(self, captured: ResponseCapture) -> List[PayloadItem]:
+        """Get webinars from the captured payloads (empty if there are none)."""
+        if self.PAYLOAD_FIELDS is None:
+            return []
+        items = captured.items(self.PAYLOAD_FIELDS)
+        if items:
+            self.logger.info(f"Found {len(items)} webinars in {len(captured.responses)} JSON responses")
+        elif captured.responses:
+            self.logger.info(f"No webinars in {len(captured.responses)} JSON responses; scraping the page")
+        return items
+    
+    def archive_page(self, page: Page, kind: str, url: Optional[str] = None):
+        """
+        Snapshot the page into the page archive, if archiving is on.
+        
+        PAGE_ARCHIVE_DIR turns archiving on (see archive.py). The reparse
+        command replays the snapshots through extract_archived() and
+        records_from_archive().
+        """
+        if self.archive is None:
+            return
+        try:
+            self.archive.put(self.SOURCE_NAME, kind, url or page.url, page.content())
+        except Exception as e:
+            self.logger.warning(f"Could not archive {url or page.url}: {e}")
+    
+    def extract_archived(self, page: Page, kind: str) -> Any:
+        """Run this collector's extraction on an archived snapshot loaded into page."""
+        raise NotImplementedError(f"{self.SOURCE_NAME} does not support reparsing")
+    
+    def records_from_archive(self, results: List[tuple]) -> Iterator[WebinarRecord]:
+        """Turn (kind, url, extract_archived() result) tuples into records."""
+        for kind, _, records in results:
+            if kind == LISTING:
+                yield from records
     
     @abstractmethod
-    def collect(self, page: Page) -> List[dict]:
-        """Collect webinars using the Playwright page. Returns list of dicts."""
+    def collect(self, page: Page) -> Iterator[WebinarRecord]:
+        """Collect webinars using the Playwright page. Yields one record per webinar."""
         pass
     
-    def run(self) -> List[dict]:
-        """Run the collector with Playwright."""
+    def _launch(self, p, profile_dir: Optional[Path]) -> BrowserContext:
+        """Start Chromium and return a browser context (persistent if profile_dir is set)."""
+        if profile_dir:
+            self.logger.info(f"Using persistent browser profile {profile_dir}")
+            context = p.chromium.launch_persistent_context(
+                str(profile_dir), headless=True, args=chromium_args()
+            )
+        else:
+            browser = p.chromium.launch(headless=True)
+            context = browser.new_context()
+        if self.trace_path:
+            context.tracing.start(screenshots=True, snapshots=True)
+        return context
+    
+    def _close(self, context: BrowserContext):
+        if self.trace_path:
+            try:
+                context.tracing.stop(path=str(self.trace_path))
+            except Exception as e:
+                self.logger.warning(f"Could not save Playwright trace: {e}")
+        browser = context.browser
+        context.close()
+        if browser:
+            browser.close()
+    
+    def checkpoint(self, persist: bool = False, **changes):
+        """
+        Update the resumable run state.
+        
+        State is saved with the next batch so it never runs ahead of the
+        committed records; persist=True flushes immediately.
+        """
+        self.state.update(changes)
+        if persist:
+            self._flush(force=True)
+    
+    def _flush(self, force: bool = False, completed: bool = False):
+        if not (self._pending or force):
+            return
+        batch, self._pending = self._pending, []
+        self._on_batch(batch, None if completed else dict(self.state))
+    
+    def run(self, on_batch: BatchCallback, resume_state: Optional[dict] = None,
+            deadline: Optional[float] = None) -> int:
+        """
+        Run the collector with Playwright.
+        
+        Records are not kept in memory: every BATCH_SIZE of them go to on_batch
+        with the checkpoint state, so results are persisted while the run is
+        in progress. If the run fails, what was yielded is still flushed and
+        the state lets the next run resume where this one stopped.
+        
+        The run stops, keeping its partial results, once TIME_BUDGET (capped
+        by deadline) is used up; Playwright timeouts are clamped to the time
+        left. With BROWSER_PROFILE_DIR set, Chromium uses a persistent profile
+        so static assets come from its disk cache (see utils/browser_profile.py).
+        Setting trace_path records a Playwright trace of the browser context.
+        Extractors with fallback chains go through ``strategies`` (see
+        strategies.py).
+        
+        Args:
+            on_batch: Called with every BATCH_SIZE records and the current run state
+            resume_state: State saved by an interrupted earlier run
+            deadline: Run-wide time.monotonic() deadline; caps TIME_BUDGET
+        
+        Returns:
+            Number of records collected in this run (partial if the run failed
+            or ran out of time)
+        """
         self.logger.info(f"Starting collection for {self.SOURCE_NAME}")
-        webinars = []
+        started = time.monotonic()
+        self.deadline = started + self.TIME_BUDGET
+        if deadline is not None:
+            self.deadline = min(self.deadline, deadline)
+        self.over_budget = False
+        self.listed = 0
+        self.failed, self.fetched = {}, set()
+        collected = 0
+        self.state = dict(resume_state or {})
+        self._on_batch = on_batch
+        self._pending = []
+        completed = False
+        
+        if resume_state:
+            self.logger.info(f"Resuming interrupted run for {self.SOURCE_NAME}")
+        
+        profile_dir = get_profile_dir(self.SOURCE_NAME)
         
         try:
+            self.check_budget()
             with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                webinars = self.collect(page)
-                browser.close()
+                context = self._launch(p, profile_dir)
+                context.set_default_timeout(self.clamp_timeout(self.DEFAULT_TIMEOUT_MS))
+                page = context.pages[0] if context.pages else context.new_page()
+                try:
+                    for record in self.collect(page):
+                        collected += 1
+                        self._pending.append(record)
+                        if len(self._pending) >= self.BATCH_SIZE:
+                            self._flush()
+                        self.check_budget()
+                        context.set_default_timeout(self.clamp_timeout(self.DEFAULT_TIMEOUT_MS))
+                finally:
+                    self._close(context)
+            completed = True
+        except BudgetExceeded:
+            self.over_budget = True
+            self.logger.warning(f"Time budget exceeded after {collected} webinars; keeping partial results")
         except Exception as e:
-            self.logger.error(f"Collection failed: {e}")
+            if self.remaining() <= 0:
+                # A clamped Playwright timeout firing at the deadline
+                self.over_budget = True
+                self.logger.warning(f"Time budget exceeded ({e}); keeping partial results")
+            else:
+                self.logger.error(f"Collection failed: {e}")
+        finally:
+            try:
+                self._flush(force=True, completed=completed)
+            except Exception as e:
+                # The pipeline stopped accepting batches; the last committed checkpoint stands
+                self.logger.error(f"Could not hand over the final batch: {e}")
+                completed = False
+            self.completed = completed
+            self.listed = max(self.listed, collected)
+            self.elapsed = time.monotonic() - started
+        
+        if profile_dir:
+            enforce_size_cap(profile_dir)
         
-        self.logger.info(f"Collected {len(webinars)} webinars from {self.SOURCE_NAME}")
-        return webinars
+        self.logger.info(f"Collected {collected} webinars from {self.SOURCE_NAME}")
+        if self.strategies.learned:
+            self.logger.info(f"Extraction strategies: {self.strategies.summary()}")
+        return collected
@@ -0,0 +1,158 @@
+"""
+Capture of the JSON (XHR/fetch) responses a listing page loads itself.
+
+Listings that fill in from an API carry title, link and dates as fields, so
+reading them from the payload is cheaper and more reliable than scraping
+rendered text. A collector lists the API URLs worth capturing and the field
+names to look for; ResponseCapture keeps matching responses and
+payload_items() walks the parsed JSON for objects that look like webinars.
+
+Only items whose link has the same form the DOM scraper produces are used,
+so records keep their unique_id whichever way they were found. Anything the
+payloads do not cover is still scraped from the DOM.
+"""
+import html
+import logging
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Pattern, Sequence
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from playwright.sync_api import Page, Response
+
+from ..utils.dates import extract_date
+
+logger = logging.getLogger("capture")
+
+_ISO_DATE = re.compile(r"^(\d{4}-\d{2}-\d{2})[T ]")
+
+
+class PayloadFields(NamedTuple):
+    """
+    Where to find webinar fields in a collector's JSON payloads.
+    
+    link_pattern must only accept webinar pages in the form the DOM scraper
+    yields; host is the host those links use, and payload links on its www.
+    or bare variant are rewritten to it before matching.
+    """
+    
+    link_pattern: str
+    host: Optional[str] = None
+    title: Sequence[str] = ("title", "name", "headline")
+    link: Sequence[str] = ("url", "link", "href", "permalink")
+    date: Sequence[str] = ()
+
+
+class PayloadItem(NamedTuple):
+    title: str
+    link: str
+    date: Optional[str]
+
+
+def _key(name: str) -> str:
+    return name.replace("_", "").replace("-", "").lower()
+
+
+def _text(value: Any) -> Optional[str]:
+    """Get a string field, unwrapping {"rendered": ...} objects (WordPress REST)."""
+    if isinstance(value, dict):
+        value = value.get("rendered")
+    if isinstance(value, str) and value.strip():
+        return html.unescape(re.sub(r"<[^>]+>", "", value)).strip()
+    return None
+
+
+def _date(value: Any) -> Optional[str]:
+    text = _text(value)
+    if not text:
+        return None
+    # "2025-11-20T17:00:00Z" - the date engine needs a word boundary after the day
+    iso = _ISO_DATE.match(text)
+    return extract_date(iso.group(1) if iso else text)
+
+
+def _canonical(link: str, host: Optional[str]) -> str:
+    """Rewrite link's host to host if it only differs by a leading www."""
+    if not host:
+        return link
+    parts = urlsplit(link)
+    if parts.netloc != host and parts.netloc.lower().removeprefix("www.") == host.removeprefix("www."):
+        return urlunsplit(parts._replace(netloc=host))
+    return link
+
+
+def _first(obj: Dict[str, Any], names: Sequence[str]) -> Any:
+    keys = {_key(k): v for k, v in obj.items()}
+    for name in names:
+        value = keys.get(_key(name))
+        if value is not None:
+            return value
+    return None
+
+
+def payload_items(data: Any, base_url: str, fields: PayloadFields) -> Iterator[PayloadItem]:
+    """Walk a JSON payload and yield every object with a title and a matching link."""
+    link_re = re.compile(fields.link_pattern)
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        
+        title = _text(_first(node, fields.title))
+        link = _text(_first(node, fields.link))
+        if title and link:
+            link = _canonical(urljoin(base_url, link), fields.host)
+            if link_re.search(link):
+                yield PayloadItem(title, link, _date(_first(node, fields.date)) if fields.date else None)
+                continue
+        stack.extend(reversed(list(node.values())))
+
+
+class ResponseCapture:
+    """Keeps the JSON XHR/fetch responses of a page whose URL matches a pattern."""
+    
+    def __init__(self, page: Page, patterns: Sequence[str]):
+        self.page = page
+        self.patterns: List[Pattern] = [re.compile(p) for p in patterns]
+        self.responses: List[Response] = []
+        self._parsed = 0
+        self._found: Dict[str, PayloadItem] = {}
+        if self.patterns:
+            page.on("response", self._on_response)
+    
+    def _on_response(self, response: Response):
+        # Bodies are read later; calling back into Playwright from a handler can deadlock
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        if not any(p.search(response.url) for p in self.patterns):
+            return
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        self.responses.append(response)
+    
+    def stop(self):
+        if self.patterns:
+            self.page.remove_listener("response", self._on_response)
+    
+    def items(self, fields: PayloadFields) -> List[PayloadItem]:
+        """
+        Get the items in all payloads captured so far, first occurrence of each link wins.
+        
+        Payloads are parsed once, so this can be called again as more arrive.
+        """
+        new, self._parsed = self.responses[self._parsed:], len(self.responses)
+        for response in new:
+            try:
+                data = response.json()
+            except Exception as e:
+                logger.debug(f"Could not read payload from {response.url}: {e}")
+                continue
+            count = 0
+            for item in payload_items(data, response.url, fields):
+                self._found.setdefault(item.link, item)
+                count += 1
+            logger.debug(f"{count} item(s) in payload from {response.url}")
+        return list(self._found.values())
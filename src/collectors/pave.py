@@ -3,26 +3,57 @@ Pave webinar collector using Playwright.
 Source: https://www.pave.com/insights/events-and-webinars
 
 Air dates are in format: "Aired on: Month Day, Year" spread across child elements.
+Webinars with a date in the JSON the page loads are taken from there instead.
 """
-from typing import List
-import re
+from typing import Collection, Iterator, List
 from playwright.sync_api import Page
 from .base import BaseCollector
+from .capture import PayloadFields
+from ..archive import LISTING
+from ..database.models import WebinarRecord
+from ..utils.dates import AIRED, extract_date
 
 
 class PaveCollector(BaseCollector):
     """Collector for Pave webinars using Playwright."""
     
     SOURCE_NAME = "Pave"
+    TIME_BUDGET = 180.0
     URL = "https://www.pave.com/insights/events-and-webinars"
+    CAPTURE_PATTERNS = (r"^https://[^/]*pave\.com/.*(/api/|graphql|\.json)",)
+    PAYLOAD_FIELDS = PayloadFields(
+        link_pattern=r"^https://explore\.pave\.com/[^?#]+",
+        host="explore.pave.com",
+        # Not a bare "date": that is usually when a post was published
+        date=("aired_on", "air_date", "event_date", "start_date", "starts_at"),
+    )
+    SITEMAP_URLS = ("https://www.pave.com/sitemap.xml", "https://explore.pave.com/sitemap.xml")
+    SITEMAP_PATTERN = r"explore\.pave\.com/|pave\.com/insights/events-and-webinars/"
     
-    def collect(self, page: Page) -> List[dict]:
+    def collect(self, page: Page) -> Iterator[WebinarRecord]:
         """Collect webinars from Pave."""
-        webinars = []
+        with self.capture(page) as captured:
+            self.goto(page, self.URL, wait_until="networkidle", timeout=30000)
+            page.wait_for_timeout(2000)
         
-        page.goto(self.URL, wait_until="networkidle", timeout=30000)
-        page.wait_for_timeout(2000)
+        payload = {item.link: item for item in self.payload_items(captured) if item.date}
+        for item in payload.values():
+            yield WebinarRecord(
+                source=self.SOURCE_NAME,
+                title=item.title[:200],
+                air_date=item.date,
+                link=item.link
+            )
         
+        self.archive_page(page, LISTING)
+        yield from self._extract_cards(page, skip=payload.keys())
+    
+    def extract_archived(self, page: Page, kind: str) -> List[WebinarRecord]:
+        """Re-run card extraction on an archived listing snapshot."""
+        return list(self._extract_cards(page)) if kind == LISTING else []
+    
+    def _extract_cards(self, page: Page, skip: Collection[str] = ()) -> Iterator[WebinarRecord]:
+        """Scrape webinar cards from the loaded listing, except links in skip."""
         # Find all webinar cards (links to explore.pave.com)
         cards = page.query_selector_all("a[href*='explore.pave.com']")
         
@@ -33,7 +64,7 @@ class PaveCollector(BaseCollector):
         for card in cards:
             try:
                 link = card.get_attribute("href")
-                if not link or link in seen_urls:
+                if not link or link in seen_urls or link in skip:
                     continue
                 seen_urls.add(link)
                 
@@ -55,35 +86,18 @@ class PaveCollector(BaseCollector):
                 if not title or len(title) < 10:
                     continue
                 
-                # Extract air date - look for "Aired on:" pattern in text
-                air_date = None
-                
+                # Extract air date - "Aired on:" first, then any date on the card.
                 # The text contains date parts separated by newlines like:
                 # "Aired on:\nNovember\n \n20\n, \n2025"
-                # Let's normalize and extract
-                text_clean = ' '.join(full_text.split())  # Normalize whitespace
+                air_date = extract_date(full_text, AIRED, fallback=True)
                 
-                # Look for "Aired on:" followed by date parts
-                aired_match = re.search(r'Aired on:\s*(\w+)\s+(\d{1,2})\s*,\s*(\d{4})', text_clean)
-                if aired_match:
-                    month, day, year = aired_match.groups()
-                    air_date = f"{month} {day}, {year}"
-                else:
-                    # Try another pattern - date might be formatted differently
-                    date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})\s*,?\s*(\d{4})', text_clean)
-                    if date_match:
-                        month, day, year = date_match.groups()
-                        air_date = f"{month} {day}, {year}"
-                
-                webinars.append({
-                    "source": self.SOURCE_NAME,
-                    "title": title[:200],
-                    "air_date": air_date,
-                    "link": link
-                })
+                yield WebinarRecord(
+                    source=self.SOURCE_NAME,
+                    title=title[:200],
+                    air_date=air_date,
+                    link=link
+                )
                 
             except Exception as e:
                 self.logger.debug(f"Error parsing card: {e}")
                 continue
-        
-        return webinars
@@ -0,0 +1,93 @@
+"""
+Learned extraction strategies.
+
+Extractors often try several ways to get a field from a card (the button's
+href, then its enclosing <a>, then a search of the parent elements), and
+whichever works usually works for every card on the page. StrategyCache
+remembers, per field, the strategy that last succeeded and tries it first,
+falling back to the full chain in priority order (and re-learning) when it
+fails.
+
+Only use it for strategies that yield the same value whenever they succeed
+(e.g. ways of finding a card's link). A chain whose fallback also succeeds,
+just with a worse answer (title heuristics), must stay in priority order.
+
+The chain still runs in full for the first card of each run and every
+RECHECK_EVERY cards after that, so a higher-priority strategy that starts
+working again takes over. Learned strategies and their hit/miss counters
+are stored in the DB between runs (extraction_strategies).
+"""
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (name, strategy) in priority order; a strategy returns a falsy value when it does not apply
+Strategies = Sequence[Tuple[str, Callable[[], Optional[T]]]]
+
+RECHECK_EVERY = 50
+
+logger = logging.getLogger("strategies")
+
+
+class StrategyCache:
+    """Per-field learned strategy with hit/miss counters."""
+    
+    def __init__(self):
+        self.learned: Dict[str, str] = {}
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._uses: Dict[str, int] = {}
+    
+    def load(self, rows: Iterable[Tuple[str, str, int, int]]):
+        """Load (field, strategy, hits, misses) rows saved by an earlier run."""
+        for field, strategy, hits, misses in rows:
+            self.learned[field] = strategy
+            self.hits[field] = hits
+            self.misses[field] = misses
+    
+    def rows(self) -> List[Tuple[str, str, int, int]]:
+        """Get (field, strategy, hits, misses) rows to save."""
+        return [
+            (field, strategy, self.hits.get(field, 0), self.misses.get(field, 0))
+            for field, strategy in sorted(self.learned.items())
+        ]
+    
+    def extract(self, field: str, strategies: Strategies) -> Optional[T]:
+        """
+        Get a field with the learned strategy, else the first strategy that works.
+        
+        A hit is the learned strategy answering on its own; a miss is it
+        failing so that the chain had to run.
+        """
+        learned = self.learned.get(field)
+        uses = self._uses.get(field, 0)
+        self._uses[field] = uses + 1
+        
+        tried = None
+        if learned and uses % RECHECK_EVERY:
+            strategy = dict(strategies).get(learned)
+            if strategy is not None:
+                value = strategy()
+                if value:
+                    self.hits[field] = self.hits.get(field, 0) + 1
+                    return value
+                self.misses[field] = self.misses.get(field, 0) + 1
+                tried = learned
+        
+        for name, strategy in strategies:
+            if name == tried:
+                continue
+            value = strategy()
+            if value:
+                if name != learned:
+                    logger.debug(f"Learned {name!r} for {field} (was {learned!r})")
+                    self.learned[field] = name
+                return value
+        return None
+    
+    def summary(self) -> str:
+        return ", ".join(
+            f"{field}: {strategy} ({self.hits.get(field, 0)} hits, {self.misses.get(field, 0)} misses)"
+            for field, strategy in sorted(self.learned.items())
+        )
@@ -6,40 +6,98 @@ The listing page shows webinar cards with:
 - Title
 - "Aired on: [date]" text
 - "Watch now" button
+
+The listing is a FacetWP faceted template. When FacetWP's pager reports more
+than one page, the remaining pages are fetched concurrently through the
+politeness scheduler and appended to the template; otherwise we scroll until
+no more cards load.
+
+Webinars found with an aired date in the WordPress REST/FacetWP JSON the page
+loads are used directly; cards are only scraped for the rest.
 """
-from typing import List, Set
-import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Iterator, List, Optional, Set
 from playwright.sync_api import Page
 from .base import BaseCollector
+from .capture import PayloadFields
+from ..archive import LISTING
+from ..database.models import WebinarRecord
+from ..utils.dates import AIRED, extract_date
+from ..utils.politeness import USER_AGENT
 
 
 class SyndioCollector(BaseCollector):
     """Collector for Syndio webinars."""
     
     SOURCE_NAME = "Syndio"
+    TIME_BUDGET = 300.0
     URL = "https://synd.io/resources/?_type=webinar"
+    PAGE_PARAM = "_paged"
+    TEMPLATE_SELECTOR = ".facetwp-template"
+    CAPTURE_PATTERNS = (r"^https://(www\.)?synd\.io/wp-json/",)
+    PAYLOAD_FIELDS = PayloadFields(
+        # Resource pages only, as the Watch now buttons link them (not REST
+        # objects such as categories, media or authors)
+        link_pattern=r"^https://synd\.io/resources/[^?#]+$",
+        host="synd.io",
+        date=("aired_on", "air_date", "aired"),
+    )
+    SITEMAP_URLS = ("https://synd.io/sitemap_index.xml",)
+    SITEMAP_PATTERN = r"^https://(www\.)?synd\.io/resources/"
     
     def __init__(self, existing_links: Set[str] = None):
         super().__init__()
         self.existing_links = existing_links or set()
     
-    def collect(self, page: Page) -> List[dict]:
+    def collect(self, page: Page) -> Iterator[WebinarRecord]:
         """Collect webinars from Syndio listing page."""
-        webinars = []
+        parsed = 0
         
-        page.goto(self.URL, wait_until="domcontentloaded", timeout=60000)
-        page.wait_for_timeout(3000)
+        with self.capture(page) as captured:
+            self.goto(page, self.URL, wait_until="domcontentloaded", timeout=60000)
+            page.wait_for_timeout(3000)
         
-        # The page shows 71 webinars - need to scroll to load more or find all cards
-        # First, let's scroll down a few times to load more content
-        for _ in range(5):
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(1000)
+        # Webinars with an aired date in the JSON payloads need no card scraping
+        payload = {item.link: item for item in self.payload_items(captured) if item.date}
+        for item in payload.values():
+            parsed += 1
+            yield WebinarRecord(
+                source=self.SOURCE_NAME,
+                title=item.title[:200],
+                air_date=item.date,
+                link=item.link
+            )
         
-        # Scroll back to top
-        page.evaluate("window.scrollTo(0, 0)")
-        page.wait_for_timeout(500)
+        pager = self._get_pager(page)
+        total_rows = (pager or {}).get("total_rows")
+        if total_rows and parsed >= total_rows:
+            # Still snapshot the (first) listing page so reparse has something to replay
+            self.archive_page(page, LISTING)
+            return
+        
+        # The listing is a FacetWP template - load every page into it up front
+        if pager and pager.get("total_pages", 1) > 1:
+            self.logger.info(
+                f"Listing reports {pager.get('total_rows')} webinars over {pager['total_pages']} pages"
+            )
+            self._load_all_pages(page, pager["total_pages"])
+        else:
+            self._scroll_until_stable(page)
+        
+        self.archive_page(page, LISTING)
+        for record in self._extract_cards(page, skip=payload.keys()):
+            parsed += 1
+            yield record
         
+        if total_rows and parsed < total_rows:
+            self.logger.warning(f"Only parsed {parsed} of {total_rows} webinars reported by the listing")
+    
+    def extract_archived(self, page: Page, kind: str) -> List[WebinarRecord]:
+        """Re-run card extraction on an archived listing snapshot."""
+        return list(self._extract_cards(page)) if kind == LISTING else []
+    
+    def _extract_cards(self, page: Page, skip: Collection[str] = ()) -> Iterator[WebinarRecord]:
+        """Scrape webinar cards from the loaded listing, except links in skip."""
         # Find all webinar cards - look for elements containing "WEBINAR" label and "Aired on"
         # Based on the screenshot, cards have: WEBINAR label, title, "Aired on: [date]", "Watch now" button
         
@@ -51,18 +109,11 @@ class SyndioCollector(BaseCollector):
         
         for button in watch_buttons:
             try:
-                # Get the link from the Watch now button or its parent
-                link = None
-                if button.get_attribute("href"):
-                    link = button.get_attribute("href")
-                else:
-                    link_parent = button.evaluate("el => el.closest('a')?.href || ''")
-                    if link_parent:
-                        link = link_parent
-                
-                if not link:
-                    # Try finding link in parent container
-                    link = button.evaluate("""el => {
+                # Get the link from the Watch now button, its enclosing <a> or a parent container
+                link = self.strategies.extract("link", (
+                    ("href", lambda: button.get_attribute("href")),
+                    ("closest", lambda: button.evaluate("el => el.closest('a')?.href || ''")),
+                    ("parent_search", lambda: button.evaluate("""el => {
                         let p = el.parentElement;
                         for(let i=0; i<10; i++) {
                             if(p) {
@@ -72,16 +123,20 @@ class SyndioCollector(BaseCollector):
                             }
                         }
                         return '';
-                    }""")
+                    }""")),
+                ))
                 
                 if not link or link in seen_urls:
                     continue
-                    
+                
                 seen_urls.add(link)
                 
                 if not link.startswith("http"):
                     link = f"https://synd.io{link}"
                 
+                if link in skip:
+                    continue
+                
                 # Get the card container text to extract title and date
                 card_text = button.evaluate("""el => {
                     let p = el.parentElement;
@@ -95,49 +150,110 @@ class SyndioCollector(BaseCollector):
                 }""")
                 
                 # Extract title - it's usually after "WEBINAR" label
-                title = None
                 lines = [l.strip() for l in card_text.split('\n') if l.strip()]
-                
-                for i, line in enumerate(lines):
-                    if line.upper() == 'WEBINAR' and i + 1 < len(lines):
-                        # Next line(s) should be the title
-                        title = lines[i + 1]
-                        break
-                
-                if not title:
-                    # Fallback - find first substantial line that's not a known label
-                    skip_words = ['WEBINAR', 'Watch now', 'Aired on']
-                    for line in lines:
-                        if len(line) > 20 and not any(sw in line for sw in skip_words):
-                            title = line
-                            break
+                # Always in priority order: the fallback also "works" on labelled cards, with the wrong line
+                title = self._title_after_label(lines) or self._first_long_line(lines)
                 
                 if not title:
                     continue
                 
                 # Extract "Aired on: [date]"
-                air_date = None
-                for line in lines:
-                    match = re.search(r'Aired on:\s*(\w+\s+\d{1,2},?\s+\d{4})', line)
-                    if match:
-                        air_date = match.group(1)
-                        break
-                
-                # Also try in full text
-                if not air_date:
-                    match = re.search(r'Aired on:\s*(\w+\s+\d{1,2},?\s+\d{4})', card_text)
-                    if match:
-                        air_date = match.group(1)
-                
-                webinars.append({
-                    "source": self.SOURCE_NAME,
-                    "title": title[:200],
-                    "air_date": air_date,
-                    "link": link
-                })
+                air_date = extract_date(card_text, AIRED)
                 
+                yield WebinarRecord(
+                    source=self.SOURCE_NAME,
+                    title=title[:200],
+                    air_date=air_date,
+                    link=link
+                )
+            
             except Exception as e:
                 self.logger.debug(f"Error parsing card: {e}")
                 continue
+    
+    @staticmethod
+    def _title_after_label(lines: List[str]) -> Optional[str]:
+        for i, line in enumerate(lines):
+            if line.upper() == 'WEBINAR' and i + 1 < len(lines):
+                # Next line(s) should be the title
+                return lines[i + 1]
+        return None
+    
+    @staticmethod
+    def _first_long_line(lines: List[str]) -> Optional[str]:
+        # Fallback - find first substantial line that's not a known label
+        skip_words = ['WEBINAR', 'Watch now', 'Aired on']
+        for line in lines:
+            if len(line) > 20 and not any(sw in line for sw in skip_words):
+                return line
+        return None
+    
+    def _get_pager(self, page: Page) -> Optional[dict]:
+        """Read FacetWP's pager settings (page, per_page, total_rows, total_pages) if present."""
+        try:
+            return page.evaluate("() => (window.FWP && FWP.settings && FWP.settings.pager) || null")
+        except Exception as e:
+            self.logger.debug(f"Could not read FacetWP pager: {e}")
+            return None
+    
+    def _load_all_pages(self, page: Page, total_pages: int):
+        """
+        Fetch listing pages 2..total_pages concurrently through the scheduler and
+        append their cards to the live template, as FacetWP's own "load more" does.
+        """
+        urls = [f"{self.URL}&{self.PAGE_PARAM}={n}" for n in range(2, total_pages + 1)]
+        with ThreadPoolExecutor(max_workers=max(1, self.scheduler.limit_for(self.URL))) as pool:
+            pages = list(pool.map(self._fetch_listing_page, urls))
+        
+        appended = page.evaluate("""([pages, templateSelector]) => {
+            const target = document.querySelector(templateSelector);
+            if (!target) return -1;
+            // Append in page order so the listing order is preserved
+            let count = 0;
+            for (const html of pages) {
+                const doc = new DOMParser().parseFromString(html, 'text/html');
+                const source = doc.querySelector(templateSelector);
+                if (!source) continue;
+                for (const child of Array.from(source.children)) {
+                    target.appendChild(document.importNode(child, true));
+                    count++;
+                }
+            }
+            return count;
+        }""", [pages, self.TEMPLATE_SELECTOR])
         
-        return webinars
+        if appended < 0:
+            self.logger.info("No FacetWP template found, falling back to scrolling")
+            self._scroll_until_stable(page)
+        else:
+            self.logger.info(f"Loaded {len(urls)} additional listing pages ({appended} elements)")
+    
+    def _fetch_listing_page(self, url: str) -> str:
+        """Get a listing page's HTML via the scheduler ("" if it failed)."""
+        try:
+            response = self.scheduler.request(
+                "GET", url, headers={"User-Agent": USER_AGENT}, timeout=max(1.0, min(30.0, self.remaining())),
+            )
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.warning(f"Could not fetch {url}: {str(e).splitlines()[0][:200]}")
+            return ""
+        self.fetched.add(url)
+        return response.text
+    
+    def _scroll_until_stable(self, page: Page, max_rounds: int = 20):
+        """Scroll to the bottom until the number of cards stops growing."""
+        previous = -1
+        for _ in range(max_rounds):
+            count = page.evaluate(
+                "Array.from(document.querySelectorAll('a, button'))"
+                ".filter(el => el.textContent.includes('Watch now')).length"
+            )
+            if count == previous:
+                break
+            previous = count
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            page.wait_for_timeout(1000)
+        
+        page.evaluate("window.scrollTo(0, 0)")
+        page.wait_for_timeout(500)
@@ -3,148 +3,314 @@ WorldatWork webinar collector using Playwright.
 Source: https://worldatwork.org/webinars?delivery=ondemand
 
 Uses Register button links which are /product/redirect/ URLs.
-Visits each detail page to get "On Demand until [date]".
+Visits each detail page to get "On Demand until [date]". The phrase is
+located in-page with a TreeWalker and only the surrounding text is returned;
+the full body text is a fallback.
 Skips entries that already exist in the database.
+
+Progress is checkpointed: the listing page reached, the links found so far
+and the detail pages still pending. A rerun after a failure resumes from there.
+Detail pages that fail to load are kept without a date and queued for retry;
+the next run fetches them again even though the link already exists.
+
+If the paginated search loads its results as JSON, links (and, when the
+payload has it, the until date) are taken from there; a webinar with a date
+from the payload needs no detail page visit.
 """
-from typing import List, Set
-import re
+from typing import Iterator, List, Optional, Set
 from playwright.sync_api import Page
-from .base import BaseCollector
+from .base import BaseCollector, BudgetExceeded
+from .capture import PayloadFields, ResponseCapture
+from ..archive import DETAIL, LISTING
+from ..database.models import WebinarRecord
+from ..utils.dates import AVAILABLE_UNTIL, extract_date
+from ..utils.logger import PER_ITEM
 
 
 class WorldatWorkCollector(BaseCollector):
     """Collector for WorldatWork on-demand webinars (public only)."""
     
     SOURCE_NAME = "WorldatWork"
+    TIME_BUDGET = 1200.0
     URL = "https://worldatwork.org/webinars?delivery=ondemand"
+    UNTIL_PHRASE = "On Demand until"
+    CAPTURE_PATTERNS = (
+        r"^https://[^/]*worldatwork\.org/.*(/api/|search|graphql)",
+        r"algolia(net)?\.(net|com|io)/",
+        r"\.coveo\.com/",
+    )
+    PAYLOAD_FIELDS = PayloadFields(
+        link_pattern=r"^https://worldatwork\.org/product/redirect/",
+        date=("on_demand_until", "available_until", "end_date", "expiration_date"),
+    )
+    SITEMAP_URLS = ("https://worldatwork.org/sitemap.xml",)
+    SITEMAP_PATTERN = r"worldatwork\.org/(product|webinars?)/"
+    SHARD_BY_ITEM = True
+    AIR_DATE_IS_EXPIRY = True
+    
+    # Find the first text node containing the phrase and return the text of
+    # its closest ancestor that also holds a year, with text nodes joined by
+    # spaces (the date is often in a sibling element). Uses textContent-style
+    # node values, so no layout is forced and only a short string is returned.
+    FIND_PHRASE_JS = """(phrase) => {
+        const textOf = (el) => {
+            const parts = [];
+            const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+            let n;
+            while ((n = walker.nextNode())) {
+                const t = n.nodeValue.trim();
+                if (t) parts.push(t);
+            }
+            return parts.join(' ');
+        };
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        let node;
+        while ((node = walker.nextNode())) {
+            if (!node.nodeValue.includes(phrase)) continue;
+            let el = node.parentElement;
+            for (let i = 0; i < 4 && el; i++, el = el.parentElement) {
+                const text = textOf(el);
+                if (text.length > 500) break;
+                if (/\\d{4}/.test(text)) return text;
+            }
+            return node.nodeValue;
+        }
+        return null;
+    }"""
     
     def __init__(self, existing_links: Set[str] = None):
         super().__init__()
         self.existing_links = existing_links or set()
     
-    def collect(self, page: Page) -> List[dict]:
+    def collect(self, page: Page) -> Iterator[WebinarRecord]:
         """Collect on-demand webinars from WorldatWork with pagination."""
-        webinars = []
-        webinar_links = []
+        if self.state.get("listing_complete"):
+            webinar_links = self.state["webinar_links"]
+            self.logger.info(f"Resuming with {len(webinar_links)} webinar links from checkpoint")
+        else:
+            webinar_links = self._collect_links(page)
+        self.listed = len(webinar_links)
+        
+        self.logger.info(f"Collected {len(webinar_links)} webinar links, now fetching dates...")
+        
+        pending = self.state.get("pending")
+        if pending is None:
+            pending = [
+                w["link"] for w in webinar_links
+                if w["link"] not in self.existing_links and self.owns(w["link"])
+            ]
+        pending = set(pending)
+        
+        # Now visit each detail page to get the air date
+        for i, webinar in enumerate(webinar_links):
+            link = webinar["link"]
+            
+            # Skip if already in database, fetched before an interruption or another shard's
+            if link not in pending:
+                reason = "already in DB" if self.owns(link) else f"shard {self.shard}"
+                self.logger.info(f"  [{i+1}/{len(webinar_links)}] Skipping ({reason}): {webinar['title'][:40]}...", extra=PER_ITEM)
+                continue
+            
+            if webinar.get("air_date"):
+                # Until date came with the listing payload
+                pending.discard(link)
+                self.checkpoint(pending=sorted(pending))
+                yield WebinarRecord(
+                    source=self.SOURCE_NAME,
+                    title=webinar["title"],
+                    air_date=webinar["air_date"],
+                    link=link
+                )
+                continue
+            
+            self.logger.info(f"  [{i+1}/{len(webinar_links)}] Fetching date for: {webinar['title'][:40]}...", extra=PER_ITEM)
+            
+            try:
+                self.goto(page, link, wait_until="domcontentloaded", timeout=20000)
+                air_date = self._extract_until_date(page)
+                self.archive_page(page, DETAIL, url=link)
+                
+            except BudgetExceeded:
+                raise
+            except Exception as e:
+                # Transient failures were queued for retry by goto()
+                self.logger.warning(f"Could not fetch date: {str(e).splitlines()[0][:120]}")
+                air_date = None
+            
+            # Saved together with this record's batch
+            pending.discard(link)
+            self.checkpoint(pending=sorted(pending))
+            
+            yield WebinarRecord(
+                source=self.SOURCE_NAME,
+                title=webinar["title"],
+                air_date=air_date,
+                link=link
+            )
+    
+    def extract_archived(self, page: Page, kind: str):
+        """Re-run extraction on an archived snapshot: link dicts for listings, the date for details."""
+        if kind == LISTING:
+            return self._extract_links(page, set())
+        # Snapshots load with JavaScript off, so the text is there or never will be
+        return self._extract_until_date(page, wait=False)
+    
+    def records_from_archive(self, results: List[tuple]) -> Iterator[WebinarRecord]:
+        """Join archived listing links with their detail page dates."""
+        dates = {url: value for kind, url, value in results if kind == DETAIL}
+        seen = set()
+        for kind, _, links in results:
+            if kind != LISTING:
+                continue
+            for webinar in links:
+                link = webinar["link"]
+                # Without a detail snapshot the date is unknown - leave the DB row alone
+                if link in seen or link not in dates:
+                    continue
+                seen.add(link)
+                yield WebinarRecord(
+                    source=self.SOURCE_NAME,
+                    title=webinar["title"],
+                    air_date=dates[link],
+                    link=link
+                )
+    
+    def _extract_until_date(self, page: Page, wait: bool = True) -> Optional[str]:
+        """Find "On Demand until [date]" on a detail page, e.g. "On Demand until December 31, 2025"."""
+        # Return as soon as the phrase is rendered instead of a fixed sleep
+        if wait:
+            try:
+                page.wait_for_function(
+                    "(phrase) => document.body && document.body.textContent.includes(phrase)",
+                    arg=self.UNTIL_PHRASE, timeout=1500,
+                )
+            except Exception:
+                pass
         
-        page.goto(self.URL, wait_until="networkidle", timeout=30000)
-        page.wait_for_timeout(3000)
+        snippet = page.evaluate(self.FIND_PHRASE_JS, self.UNTIL_PHRASE)
+        air_date = extract_date(snippet, AVAILABLE_UNTIL) if snippet else None
         
+        if air_date is None:
+            # Fallback: phrase split across elements or phrased differently
+            air_date = extract_date(page.inner_text("body"), AVAILABLE_UNTIL)
+        return air_date
+    
+    def _collect_links(self, page: Page) -> List[dict]:
+        """Walk the listing pages and collect title/link pairs, checkpointing each page."""
+        webinar_links = list(self.state.get("webinar_links", []))
+        resume_page = self.state.get("listing_page", 1)
+        
+        with self.capture(page) as captured:
+            self.goto(page, self.URL, wait_until="networkidle", timeout=30000)
+            page.wait_for_timeout(3000)
+            return self._walk_listing(page, captured, webinar_links, resume_page)
+    
+    def _walk_listing(self, page: Page, captured: ResponseCapture,
+                      webinar_links: List[dict], resume_page: int) -> List[dict]:
+        """Collect links from each listing page, from the captured JSON first and then the DOM."""
         page_num = 1
         max_pages = 10
         
+        # Click through pages already collected by an interrupted run
+        while page_num < resume_page and self._next_page(page):
+            page_num += 1
+        
         # Collect all webinar links from listing pages
         while page_num <= max_pages:
             self.logger.info(f"Collecting links from page {page_num}")
             
-            # Find all Register buttons (a tags with href=/product/redirect/)
-            register_links = page.query_selector_all("a[href*='/product/redirect/']")
-            
+            # Webinars in the search results JSON loaded for this page
             found_on_page = 0
-            for register_link in register_links:
-                try:
-                    href = register_link.get_attribute("href")
-                    if not href:
-                        continue
-                    
-                    if not href.startswith("http"):
-                        href = f"https://worldatwork.org{href}"
-                    
-                    # Skip duplicates
-                    if any(w['link'] == href for w in webinar_links):
-                        continue
-                    
-                    # Get title - navigate up to find the card container and get title
-                    # The structure has the title in a span above the register button
-                    card_text = register_link.evaluate("""el => {
-                        let p = el.parentElement;
-                        for(let i=0; i<10; i++) {
-                            if(p && p.innerText && p.innerText.length > 50) {
-                                return p.innerText;
-                            }
-                            if(p) p = p.parentElement;
-                        }
-                        return '';
-                    }""")
-                    
-                    # Extract title from card text
-                    lines = [l.strip() for l in card_text.split('\n') if l.strip()]
-                    title = None
-                    skip_keywords = ['Featured', 'On Demand', 'Gain Recertification Credits', 
-                                   'Register', 'Member Only Access', 'Exclusive']
-                    
-                    for line in lines:
-                        if (len(line) > 15 and 
-                            line not in skip_keywords and
-                            not line.startswith('On Demand')):
-                            title = line
-                            break
-                    
-                    if title:
-                        webinar_links.append({
-                            "title": title[:200],
-                            "link": href
-                        })
-                        found_on_page += 1
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error parsing item: {e}")
-                    continue
+            known = {w["link"] for w in webinar_links}
+            for item in self.payload_items(captured):
+                if item.link not in known:
+                    webinar_links.append({"title": item.title[:200], "link": item.link, "air_date": item.date})
+                    known.add(item.link)
+                    found_on_page += 1
+            
+            self.archive_page(page, LISTING, url=f"{self.URL}#page={page_num}")
+            new_links = self._extract_links(page, known)
+            webinar_links.extend(new_links)
+            found_on_page += len(new_links)
             
             self.logger.info(f"Found {found_on_page} webinars on page {page_num} (total: {len(webinar_links)})")
             
-            # Next page using user's XPath
-            next_button = page.locator("xpath=/html/body/div[3]/div[6]/div/div/div/div/div[2]/div[3]/nav/ul/li[3]/button")
-            if next_button.count() > 0 and next_button.is_enabled():
-                try:
-                    next_button.click()
-                    page.wait_for_timeout(2000)
-                    page_num += 1
-                except:
-                    break
+            self.checkpoint(persist=True, webinar_links=webinar_links, listing_page=page_num)
+            
+            if self._next_page(page):
+                page_num += 1
             else:
                 break
         
-        self.logger.info(f"Collected {len(webinar_links)} webinar links, now fetching dates...")
+        self.checkpoint(persist=True, webinar_links=webinar_links, listing_complete=True)
+        return webinar_links
+    
+    def _extract_links(self, page: Page, known: Set[str]) -> List[dict]:
+        """Get title/link pairs from the current listing page, skipping (and adding to) known links."""
+        links = []
+        # Find all Register buttons (a tags with href=/product/redirect/)
+        register_links = page.query_selector_all("a[href*='/product/redirect/']")
         
-        # Now visit each detail page to get the air date
-        for i, webinar in enumerate(webinar_links):
-            link = webinar["link"]
-            
-            # Skip if already in database
-            if link in self.existing_links:
-                self.logger.info(f"  [{i+1}/{len(webinar_links)}] Skipping (already in DB): {webinar['title'][:40]}...")
-                continue
-            
-            self.logger.info(f"  [{i+1}/{len(webinar_links)}] Fetching date for: {webinar['title'][:40]}...")
-            
+        for register_link in register_links:
             try:
-                page.goto(link, wait_until="domcontentloaded", timeout=20000)
-                page.wait_for_timeout(1500)
+                href = register_link.get_attribute("href")
+                if not href:
+                    continue
                 
-                # Look for "On Demand until [date]" text
-                air_date = None
-                page_text = page.inner_text("body")
+                if not href.startswith("http"):
+                    href = f"https://worldatwork.org{href}"
                 
-                # Pattern: "On Demand until December 31, 2025"
-                match = re.search(r'On Demand until\s+(\w+\s+\d{1,2},?\s+\d{4})', page_text)
-                if match:
-                    air_date = match.group(1)
+                # Skip duplicates
+                if href in known:
+                    continue
                 
-                webinars.append({
-                    "source": self.SOURCE_NAME,
-                    "title": webinar["title"],
-                    "air_date": air_date,
-                    "link": link
-                })
+                # Get title - navigate up to find the card container and get title
+                # The structure has the title in a span above the register button
+                card_text = register_link.evaluate("""el => {
+                    let p = el.parentElement;
+                    for(let i=0; i<10; i++) {
+                        if(p && p.innerText && p.innerText.length > 50) {
+                            return p.innerText;
+                        }
+                        if(p) p = p.parentElement;
+                    }
+                    return '';
+                }""")
                 
+                # Extract title from card text
+                lines = [l.strip() for l in card_text.split('\n') if l.strip()]
+                title = None
+                skip_keywords = ['Featured', 'On Demand', 'Gain Recertification Credits', 
+                               'Register', 'Member Only Access', 'Exclusive']
+                
+                for line in lines:
+                    if (len(line) > 15 and 
+                        line not in skip_keywords and
+                        not line.startswith('On Demand')):
+                        title = line
+                        break
+                
+                if title:
+                    links.append({
+                        "title": title[:200],
+                        "link": href
+                    })
+                    known.add(href)
+                    
             except Exception as e:
-                self.logger.debug(f"Error fetching detail page: {e}")
-                webinars.append({
-                    "source": self.SOURCE_NAME,
-                    "title": webinar["title"],
-                    "air_date": None,
-                    "link": link
-                })
-        
-        return webinars
+                self.logger.debug(f"Error parsing item: {e}")
+                continue
+        return links
+    
+    def _next_page(self, page: Page) -> bool:
+        """Go to the next listing page. Returns False on the last page."""
+        # Next page using user's XPath
+        next_button = page.locator("xpath=/html/body/div[3]/div[6]/div/div/div/div/div[2]/div[3]/nav/ul/li[3]/button")
+        if next_button.count() > 0 and next_button.is_enabled():
+            try:
+                next_button.click()
+                page.wait_for_timeout(2000)
+                return True
+            except:
+                return False
+        return False
@@ -1,4 +1,12 @@
-from .db_manager import DatabaseManager
-from .models import Webinar
+from .db_manager import DatabaseManager, INSERTED, UPDATED, UNCHANGED, EXPIRED
+from .models import WebinarRecord
 
-__all__ = ["DatabaseManager", "Webinar"]
+__all__ = ["DatabaseManager", "Webinar", "WebinarRecord", "validate_records", "INSERTED", "UPDATED", "UNCHANGED", "EXPIRED"]
+
+
+def __getattr__(name):
+    # Loaded on first use to keep pydantic out of the import path
+    if name in ("Webinar", "validate_records"):
+        from . import validation
+        return getattr(validation, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
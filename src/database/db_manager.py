@@ -1,20 +1,100 @@
 """
 Simplified SQLite database manager with duplicate checking.
+
+Rows carry a content hash so that re-scraped webinars whose title and
+air date have not changed are left untouched (``last_updated`` only moves
+when the content actually changes).
+
+Every insert and real update is also appended to the ``webinar_changes``
+log in the same transaction. Downstream consumers read it with
+``changes_since(seq)`` and store their position with ``save_checkpoint()``.
+
+Collectors persist their progress in ``run_state`` alongside each committed
+batch (``commit_batch()``) so an interrupted run can resume where it stopped.
+
+Pages that failed to load with a transient error are kept in
+``fetch_failures`` (``save_fetch_results()``) and revisited on the next run.
+
+``provider_stats`` holds per-source totals, rows without an air date, the
+date range and crawl yields. Triggers on ``webinars`` keep it current, so
+reports read it without scanning the table.
+
+Collectors' learned extraction strategies and their hit/miss counters are
+kept in ``extraction_strategies`` between runs.
+
+``sitemap_urls`` indexes each provider's sitemap entries by lastmod; entries
+that are new or modified since the last completed crawl are "pending".
+
+Shard DBs from `collect --shard` are combined with ``merge_shard()``.
+
+For sources whose air_date is an "available until" date, ``archive_expired()``
+moves rows past that date from ``webinars`` to ``webinars_archive`` (logged as
+EXPIRED). Reads and exports cover live rows only, so the hot table stays the
+size of what can still be watched.
 """
+import json
 import sqlite3
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import List, Optional, Set
-from .models import Webinar
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Set, Union
+from .models import WebinarRecord, make_content_hash
+from ..utils.dates import extract_date
+
+if TYPE_CHECKING:
+    from .validation import Webinar
+
+# Outcomes of upsert_webinar()
+INSERTED = "inserted"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+# Change log op for rows moved to the archive
+EXPIRED = "expired"
+
+# Formats air_date has been stored in ("Month D, YYYY" since the shared date engine)
+_DATE_FORMATS = ("%B %d, %Y", "%B %d %Y", "%b %d, %Y", "%b %d %Y")
+
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# air_date as YYYY-MM-DD (NULL if it is not in one of the formats above), so it sorts
+_SORTABLE_DATE_SQL = (
+    "CASE WHEN air_date GLOB '* [0-9][0-9][0-9][0-9]' THEN "
+    "substr(air_date, -4) || '-' || "
+    "CASE substr(air_date, 1, 3) "
+    + " ".join(f"WHEN '{m}' THEN '{i:02d}'" for i, m in enumerate(_MONTHS, 1))
+    + " END || '-' || "
+    "substr('0' || trim(substr(air_date, instr(air_date, ' ') + 1, 2), ' ,'), -2) END"
+)
+
+
+def _like_pattern(text: str) -> str:
+    """LIKE pattern matching text anywhere (with ESCAPE '\\')."""
+    pattern = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{pattern}%"
+
+
+def _parse_date(value: str) -> Optional[date]:
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
 
 
 class DatabaseManager:
     """Manages SQLite database for webinar records."""
     
-    def __init__(self, db_path: str = "data/webinars.db"):
+    def __init__(self, db_path: str = "data/webinars.db", init: bool = True):
+        """
+        Args:
+            db_path: SQLite file (created if missing)
+            init: Create and migrate the schema; False for read-only use of
+                a DB that is already up to date
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        if init:
+            self._init_db()
     
     def _init_db(self):
         """Initialize database schema."""
@@ -27,21 +107,252 @@ class DatabaseManager:
                     title TEXT NOT NULL,
                     air_date TEXT,
                     link TEXT NOT NULL,
-                    last_updated TEXT NOT NULL
+                    last_updated TEXT NOT NULL,
+                    content_hash TEXT
                 )
             """)
+            self._migrate_content_hash(conn)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_source ON webinars(source)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_link ON webinars(link)")
+            self._init_provider_stats(conn)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS webinars_archive (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    unique_id TEXT UNIQUE NOT NULL,
+                    source TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    air_date TEXT,
+                    link TEXT NOT NULL,
+                    last_updated TEXT NOT NULL,
+                    content_hash TEXT,
+                    archived_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_archive_source ON webinars_archive(source)")
+            self._init_change_log(conn)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS run_state (
+                    source TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fetch_failures (
+                    source TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    error TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    first_failed TEXT NOT NULL,
+                    last_failed TEXT NOT NULL,
+                    PRIMARY KEY (source, url)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sitemap_urls (
+                    source TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    lastmod TEXT,
+                    crawled_lastmod TEXT,
+                    first_seen TEXT NOT NULL,
+                    PRIMARY KEY (source, url)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sitemap_crawls (
+                    source TEXT PRIMARY KEY,
+                    crawled_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS extraction_strategies (
+                    source TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    strategy TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    misses INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (source, field)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            self._migrate_air_dates(conn)
             conn.commit()
     
+    def _init_change_log(self, conn: sqlite3.Connection):
+        """Create the append-only change log and consumer checkpoints."""
+        log_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'webinar_changes'"
+        ).fetchone()
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS webinar_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                unique_id TEXT NOT NULL,
+                op TEXT NOT NULL,
+                source TEXT NOT NULL,
+                title TEXT NOT NULL,
+                air_date TEXT,
+                link TEXT NOT NULL,
+                changed_at TEXT NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS change_checkpoints (
+                consumer TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_changes_uid ON webinar_changes(unique_id, changed_at)")
+        
+        # Seed the log with existing rows so a consumer starting at 0 sees everything
+        if not log_exists:
+            conn.execute("""
+                INSERT INTO webinar_changes (unique_id, op, source, title, air_date, link, changed_at)
+                SELECT unique_id, ?, source, title, air_date, link, last_updated
+                FROM webinars ORDER BY id
+            """, (INSERTED,))
+    
+    def _init_provider_stats(self, conn: sqlite3.Connection):
+        """Create provider_stats and the triggers that keep it in step with webinars."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(webinars)")}
+        if "air_date_sort" not in columns:
+            conn.execute(
+                f"ALTER TABLE webinars ADD COLUMN air_date_sort TEXT GENERATED ALWAYS AS ({_SORTABLE_DATE_SQL}) VIRTUAL"
+            )
+        # Makes the min/max lookups in the triggers index seeks
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_source_date ON webinars(source, air_date_sort)")
+        
+        stats_exist = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'provider_stats'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS provider_stats (
+                source TEXT PRIMARY KEY,
+                total INTEGER NOT NULL DEFAULT 0,
+                missing_dates INTEGER NOT NULL DEFAULT 0,
+                min_date TEXT,
+                max_date TEXT,
+                last_updated TEXT,
+                last_crawl TEXT,
+                last_yield INTEGER,
+                prev_yield INTEGER
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS provider_stats_insert AFTER INSERT ON webinars BEGIN
+                INSERT INTO provider_stats (source, total, missing_dates, min_date, max_date, last_updated)
+                VALUES (NEW.source, 1, NEW.air_date IS NULL, NEW.air_date_sort, NEW.air_date_sort, NEW.last_updated)
+                ON CONFLICT (source) DO UPDATE SET
+                    total = total + 1,
+                    missing_dates = missing_dates + (NEW.air_date IS NULL),
+                    min_date = CASE WHEN min_date IS NULL OR NEW.air_date_sort < min_date
+                               THEN NEW.air_date_sort ELSE min_date END,
+                    max_date = CASE WHEN max_date IS NULL OR NEW.air_date_sort > max_date
+                               THEN NEW.air_date_sort ELSE max_date END,
+                    last_updated = max(coalesce(last_updated, ''), NEW.last_updated);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS provider_stats_update AFTER UPDATE ON webinars BEGIN
+                UPDATE provider_stats SET
+                    missing_dates = missing_dates + (NEW.air_date IS NULL) - (OLD.air_date IS NULL),
+                    min_date = (SELECT MIN(air_date_sort) FROM webinars WHERE source = NEW.source),
+                    max_date = (SELECT MAX(air_date_sort) FROM webinars WHERE source = NEW.source),
+                    last_updated = max(coalesce(last_updated, ''), NEW.last_updated)
+                WHERE source = NEW.source;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS provider_stats_delete AFTER DELETE ON webinars BEGIN
+                UPDATE provider_stats SET
+                    total = total - 1,
+                    missing_dates = missing_dates - (OLD.air_date IS NULL),
+                    min_date = CASE WHEN OLD.air_date_sort = min_date
+                               THEN (SELECT MIN(air_date_sort) FROM webinars WHERE source = OLD.source)
+                               ELSE min_date END,
+                    max_date = CASE WHEN OLD.air_date_sort = max_date
+                               THEN (SELECT MAX(air_date_sort) FROM webinars WHERE source = OLD.source)
+                               ELSE max_date END
+                WHERE source = OLD.source;
+            END
+        """)
+        
+        # Backfill once from the rows already there
+        if not stats_exist:
+            conn.execute("""
+                INSERT INTO provider_stats (source, total, missing_dates, min_date, max_date, last_updated)
+                SELECT source, COUNT(*), SUM(air_date IS NULL), MIN(air_date_sort), MAX(air_date_sort),
+                       MAX(last_updated)
+                FROM webinars GROUP BY source
+            """)
+    
+    def _migrate_content_hash(self, conn: sqlite3.Connection):
+        """Add and backfill content_hash on databases created before it existed."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(webinars)")}
+        if "content_hash" not in columns:
+            conn.execute("ALTER TABLE webinars ADD COLUMN content_hash TEXT")
+        
+        # Backfill without touching last_updated
+        rows = conn.execute(
+            "SELECT id, title, air_date FROM webinars WHERE content_hash IS NULL"
+        ).fetchall()
+        conn.executemany(
+            "UPDATE webinars SET content_hash = ? WHERE id = ?",
+            [
+                (make_content_hash(title, air_date), row_id)
+                for row_id, title, air_date in rows
+            ],
+        )
+    
+    def _migrate_air_dates(self, conn: sqlite3.Connection):
+        """
+        Rewrite air dates stored before the shared date engine as "Month D, YYYY".
+        
+        Hashes are recomputed so the next crawl sees these rows as unchanged;
+        last_updated and the change log are left alone, since only the format
+        changed. Runs once per DB.
+        """
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'air_dates_normalised'").fetchone():
+            return
+        for table in ("webinars", "webinars_archive"):
+            rows = conn.execute(
+                f"SELECT id, title, air_date FROM {table} WHERE air_date IS NOT NULL"
+            ).fetchall()
+            updates = []
+            for row_id, title, air_date in rows:
+                normalised = extract_date(air_date)
+                if normalised and normalised != air_date:
+                    updates.append((normalised, make_content_hash(title, normalised), row_id))
+            conn.executemany(f"UPDATE {table} SET air_date = ?, content_hash = ? WHERE id = ?", updates)
+        conn.execute("INSERT INTO meta (key, value) VALUES ('air_dates_normalised', '1')")
+    
     def get_existing_links(self, source: str) -> Set[str]:
-        """Get all existing links for a source to avoid re-scraping."""
+        """
+        Get the live links of a source to avoid re-scraping.
+        
+        Archived links are left out so that ones still on the listing are
+        checked again, in case their "until" date was extended.
+        """
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT link FROM webinars WHERE source = ?", (source,)
-            )
+            cursor = conn.execute("SELECT link FROM webinars WHERE source = ?", (source,))
             return {row[0] for row in cursor.fetchall()}
     
+    def get_archived_ids(self, source: Optional[str] = None) -> Set[str]:
+        """Get the unique_ids in webinars_archive, optionally for one source."""
+        query, params = "SELECT unique_id FROM webinars_archive", ()
+        if source:
+            query, params = query + " WHERE source = ?", (source,)
+        with sqlite3.connect(self.db_path) as conn:
+            return {row[0] for row in conn.execute(query, params)}
+    
     def link_exists(self, link: str) -> bool:
         """Check if a link already exists in the database."""
         with sqlite3.connect(self.db_path) as conn:
@@ -50,46 +361,540 @@ class DatabaseManager:
             )
             return cursor.fetchone() is not None
     
-    def upsert_webinar(self, webinar: Webinar) -> bool:
-        """Insert or update a webinar. Returns True if inserted."""
+    def upsert_webinar(self, webinar: Union["Webinar", WebinarRecord]) -> str:
+        """
+        Insert or update a webinar.
+        
+        Existing rows are only written when their content hash differs.
+        Returns INSERTED, UPDATED or UNCHANGED.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            result = self._upsert(conn, webinar)
+            conn.commit()
+            return result
+    
+    def _upsert(self, conn: sqlite3.Connection, webinar: Union["Webinar", WebinarRecord]) -> str:
+        """Upsert a single webinar on an open connection (no commit)."""
         unique_id = webinar.unique_id
+        content_hash = webinar.content_hash
         now = datetime.utcnow().isoformat()
         
+        cursor = conn.execute(
+            "SELECT content_hash FROM webinars WHERE unique_id = ?", (unique_id,)
+        )
+        existing = cursor.fetchone()
+        
+        if existing:
+            if existing[0] == content_hash:
+                return UNCHANGED
+            conn.execute("""
+                UPDATE webinars SET
+                    title = ?, air_date = ?, last_updated = ?, content_hash = ?
+                WHERE unique_id = ?
+            """, (webinar.title, webinar.air_date, now, content_hash, unique_id))
+            self._log_change(conn, webinar, UPDATED, now)
+            return UPDATED
+        
+        archived = conn.execute(
+            "SELECT content_hash FROM webinars_archive WHERE unique_id = ?", (unique_id,)
+        ).fetchone()
+        if archived and archived[0] == content_hash:
+            # Re-checked but still the same expired webinar
+            return UNCHANGED
+        
+        conn.execute("""
+            INSERT INTO webinars (unique_id, source, title, air_date, link, last_updated, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (unique_id, webinar.source, webinar.title, webinar.air_date, webinar.link, now, content_hash))
+        # Back on the site (e.g. availability extended) - the live row replaces the archived one
+        conn.execute("DELETE FROM webinars_archive WHERE unique_id = ?", (unique_id,))
+        self._log_change(conn, webinar, INSERTED, now)
+        return INSERTED
+    
+    def _log_change(self, conn: sqlite3.Connection, webinar: Union["Webinar", WebinarRecord], op: str, changed_at: str):
+        """Append a row to the change log (caller owns the transaction)."""
+        conn.execute("""
+            INSERT INTO webinar_changes (unique_id, op, source, title, air_date, link, changed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (webinar.unique_id, op, webinar.source, webinar.title, webinar.air_date, webinar.link, changed_at))
+    
+    def bulk_upsert(self, webinars: List[Union["Webinar", WebinarRecord]]) -> tuple[int, int, int]:
+        """Bulk insert/update in one transaction. Returns (inserted, updated, unchanged)."""
+        with sqlite3.connect(self.db_path) as conn:
+            counts = self._bulk_upsert(conn, webinars)
+            conn.commit()
+        return counts
+    
+    def _bulk_upsert(self, conn: sqlite3.Connection, webinars: List[Union["Webinar", WebinarRecord]]) -> tuple[int, int, int]:
+        counts = {INSERTED: 0, UPDATED: 0, UNCHANGED: 0}
+        for w in webinars:
+            counts[self._upsert(conn, w)] += 1
+        return counts[INSERTED], counts[UPDATED], counts[UNCHANGED]
+    
+    def commit_batch(self, source: str, webinars: List[Union["Webinar", WebinarRecord]],
+                     run_state: Optional[dict]) -> tuple[int, int, int]:
+        """
+        Upsert a batch and save the collector's run state in one transaction.
+        
+        A run_state of None clears the checkpoint (the run completed).
+        Returns (inserted, updated, unchanged).
+        """
+        now = datetime.utcnow().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            counts = self._bulk_upsert(conn, webinars)
+            if run_state is None:
+                conn.execute("DELETE FROM run_state WHERE source = ?", (source,))
+            else:
+                conn.execute("""
+                    INSERT INTO run_state (source, state, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(source) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at
+                """, (source, json.dumps(run_state), now))
+            conn.commit()
+        return counts
+    
+    def get_run_state(self, source: str) -> Optional[dict]:
+        """Get the saved checkpoint of an interrupted run for a source, if any."""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
-                "SELECT id FROM webinars WHERE unique_id = ?", (unique_id,)
+                "SELECT state FROM run_state WHERE source = ?", (source,)
             )
-            existing = cursor.fetchone()
-            
-            if existing:
-                conn.execute("""
-                    UPDATE webinars SET
-                        title = ?, air_date = ?, last_updated = ?
-                    WHERE unique_id = ?
-                """, (webinar.title, webinar.air_date, now, unique_id))
+            row = cursor.fetchone()
+            return json.loads(row[0]) if row else None
+    
+    def save_fetch_results(self, source: str, failed: Dict[str, str], fetched: Iterable[str]):
+        """
+        Update a source's retry queue after a run.
+        
+        failed maps URLs that still failed to their error (attempts counts
+        the runs they failed in); URLs in fetched have loaded and are removed.
+        """
+        now = datetime.utcnow().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "DELETE FROM fetch_failures WHERE source = ? AND url = ?",
+                [(source, url) for url in fetched if url not in failed],
+            )
+            conn.executemany("""
+                INSERT INTO fetch_failures (source, url, error, attempts, first_failed, last_failed)
+                VALUES (?, ?, ?, 1, ?, ?)
+                ON CONFLICT(source, url) DO UPDATE SET
+                    error = excluded.error, attempts = attempts + 1, last_failed = excluded.last_failed
+            """, [(source, url, error, now, now) for url, error in failed.items()])
+            conn.commit()
+    
+    def get_retry_links(self, source: str) -> Set[str]:
+        """Get the URLs of a source that failed to load on earlier runs."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT url FROM fetch_failures WHERE source = ?", (source,)
+            )
+            return {row[0] for row in cursor.fetchall()}
+    
+    def get_strategies(self, source: str) -> List[tuple]:
+        """Get a collector's learned extraction strategies as (field, strategy, hits, misses)."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT field, strategy, hits, misses FROM extraction_strategies WHERE source = ?",
+                (source,),
+            )
+            return cursor.fetchall()
+    
+    def save_strategies(self, source: str, rows: Iterable[tuple]):
+        """Store a collector's (field, strategy, hits, misses) rows."""
+        now = datetime.utcnow().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT INTO extraction_strategies (source, field, strategy, hits, misses, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, field) DO UPDATE SET
+                    strategy = excluded.strategy, hits = excluded.hits,
+                    misses = excluded.misses, updated_at = excluded.updated_at
+            """, [(source, *row, now) for row in rows])
+            conn.commit()
+    
+    def update_sitemap(self, source: str, entries: Iterable[tuple], batch_size: int = 1000) -> int:
+        """
+        Upsert (url, lastmod) sitemap entries for a source. Returns the number of entries seen.
+        
+        entries may stream from the network, so each batch is committed on its
+        own: the write lock is never held while the next sitemap downloads.
+        """
+        now = datetime.utcnow().isoformat()
+        count = 0
+        batch = []
+        for url, lastmod in entries:
+            batch.append((source, url, lastmod, now))
+            if len(batch) >= batch_size:
+                count += self._upsert_sitemap(batch)
+                batch = []
+        count += self._upsert_sitemap(batch)
+        return count
+    
+    def _upsert_sitemap(self, batch: List[tuple]) -> int:
+        if batch:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany("""
+                    INSERT INTO sitemap_urls (source, url, lastmod, first_seen) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(source, url) DO UPDATE SET lastmod = excluded.lastmod
+                """, batch)
                 conn.commit()
-                return False
-            else:
+        return len(batch)
+    
+    def pending_sitemap_urls(self, source: str) -> List[str]:
+        """Get sitemap URLs that are new or whose lastmod changed since the last completed crawl."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("""
+                SELECT url FROM sitemap_urls
+                WHERE source = ? AND (crawled_lastmod IS NULL OR crawled_lastmod != COALESCE(lastmod, ''))
+                ORDER BY url
+            """, (source,))
+            return [row[0] for row in cursor.fetchall()]
+    
+    def mark_sitemap_crawled(self, source: str):
+        """Record a completed crawl: every indexed URL of the source is now up to date."""
+        now = datetime.utcnow().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE sitemap_urls SET crawled_lastmod = COALESCE(lastmod, '') WHERE source = ?",
+                (source,),
+            )
+            conn.execute("""
+                INSERT INTO sitemap_crawls (source, crawled_at) VALUES (?, ?)
+                ON CONFLICT(source) DO UPDATE SET crawled_at = excluded.crawled_at
+            """, (source, now))
+            conn.commit()
+    
+    def last_sitemap_crawl(self, source: str) -> Optional[str]:
+        """Get when a source was last crawled completely with discovery on (ISO timestamp)."""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT crawled_at FROM sitemap_crawls WHERE source = ?", (source,)
+            ).fetchone()
+            return row[0] if row else None
+    
+    def save_shard_info(self, index: int, count: int, item_sources: List[str]):
+        """Record which shard of a sharded collection this DB holds."""
+        info = json.dumps({"index": index, "count": count, "item_sources": sorted(item_sources)})
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO meta (key, value) VALUES ('shard', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """, (info,))
+            conn.commit()
+    
+    def get_shard_info(self) -> Optional[dict]:
+        """Get the shard this DB holds, or None if it is not a shard."""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'shard'").fetchone()
+            return json.loads(row[0]) if row else None
+    
+    def merge_shard(self, shard_path: str,
+                    owns_failure: Optional[Callable[[str, str], bool]] = None) -> Dict[str, int]:
+        """
+        Merge another DB (a shard) into this one in a single transaction.
+        
+        Webinars: the row with the newer last_updated wins if its content
+        differs. Change log: one entry per webinar the merge inserts or changes
+        (rows it leaves alone are not logged again). Crawl history in
+        provider_stats: the newer last_crawl wins. Retry queue: with
+        owns_failure(source, url), entries the shard owns are replaced by the
+        shard's; without it, the more recent failure of each URL is kept.
+        
+        Returns counts of webinars written and changes appended.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("ATTACH DATABASE ? AS shard", (str(shard_path),))
+            try:
+                # Decide before writing which rows are new and which really change
+                conn.execute("DROP TABLE IF EXISTS temp.merge_ops")
+                conn.execute("""
+                    CREATE TEMP TABLE merge_ops AS
+                    SELECT s.id, s.unique_id, CASE WHEN w.unique_id IS NULL THEN ? ELSE ? END AS op
+                    FROM shard.webinars s LEFT JOIN main.webinars w ON w.unique_id = s.unique_id
+                    WHERE w.unique_id IS NULL
+                       OR (s.last_updated > w.last_updated AND s.content_hash IS NOT w.content_hash)
+                """, (INSERTED, UPDATED))
+                
+                # rowcount, not total_changes: the provider_stats triggers write rows too
+                cursor = conn.execute("""
+                    INSERT INTO webinars (unique_id, source, title, air_date, link, last_updated, content_hash)
+                    SELECT unique_id, source, title, air_date, link, last_updated, content_hash
+                    FROM shard.webinars WHERE true ORDER BY id
+                    ON CONFLICT(unique_id) DO UPDATE SET
+                        title = excluded.title, air_date = excluded.air_date, link = excluded.link,
+                        last_updated = excluded.last_updated, content_hash = excluded.content_hash
+                    WHERE excluded.last_updated > webinars.last_updated
+                      AND excluded.content_hash IS NOT webinars.content_hash
+                """)
+                webinars = cursor.rowcount
+                
+                cursor = conn.execute("""
+                    INSERT INTO webinar_changes (unique_id, op, source, title, air_date, link, changed_at)
+                    SELECT s.unique_id, m.op, s.source, s.title, s.air_date, s.link, s.last_updated
+                    FROM temp.merge_ops m JOIN shard.webinars s ON s.id = m.id
+                    ORDER BY s.last_updated, s.id
+                """)
+                changes = cursor.rowcount
+                conn.execute("DROP TABLE temp.merge_ops")
+                
+                # Crawl history: the most recent crawl of each source wins
                 conn.execute("""
-                    INSERT INTO webinars (unique_id, source, title, air_date, link, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (unique_id, webinar.source, webinar.title, webinar.air_date, webinar.link, now))
+                    INSERT INTO provider_stats (source, last_crawl, last_yield, prev_yield)
+                    SELECT source, last_crawl, last_yield, prev_yield
+                    FROM shard.provider_stats WHERE last_crawl IS NOT NULL
+                    ON CONFLICT(source) DO UPDATE SET
+                        last_crawl = excluded.last_crawl, last_yield = excluded.last_yield,
+                        prev_yield = excluded.prev_yield
+                    WHERE provider_stats.last_crawl IS NULL OR excluded.last_crawl > provider_stats.last_crawl
+                """)
+                
+                self._merge_fetch_failures(conn, owns_failure)
                 conn.commit()
-                return True
+            finally:
+                conn.execute("DETACH DATABASE shard")
+        return {"webinars": webinars, "changes": changes}
     
-    def bulk_upsert(self, webinars: List[Webinar]) -> tuple[int, int]:
-        """Bulk insert/update. Returns (inserted, updated)."""
-        inserted = updated = 0
-        for w in webinars:
-            if self.upsert_webinar(w):
-                inserted += 1
-            else:
-                updated += 1
-        return inserted, updated
+    def _merge_fetch_failures(self, conn: sqlite3.Connection,
+                              owns_failure: Optional[Callable[[str, str], bool]]):
+        columns = "source, url, error, attempts, first_failed, last_failed"
+        rows = conn.execute(f"SELECT {columns} FROM shard.fetch_failures").fetchall()
+        if owns_failure is not None:
+            owned = [
+                (source, url)
+                for source, url in conn.execute("SELECT source, url FROM fetch_failures")
+                if owns_failure(source, url)
+            ]
+            conn.executemany("DELETE FROM fetch_failures WHERE source = ? AND url = ?", owned)
+            rows = [row for row in rows if owns_failure(row[0], row[1])]
+        conn.executemany(f"""
+            INSERT INTO fetch_failures ({columns}) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source, url) DO UPDATE SET
+                error = excluded.error, attempts = excluded.attempts, last_failed = excluded.last_failed
+            WHERE excluded.last_failed > fetch_failures.last_failed
+        """, rows)
+    
+    def archive_expired(self, sources: Iterable[str], today: Optional[date] = None,
+                        batch_size: int = 500) -> int:
+        """
+        Move rows whose air_date has passed to webinars_archive.
+        
+        Only for sources where air_date means "available until". Rows are
+        moved (and logged as EXPIRED) in transactions of batch_size.
+        Returns the number of rows archived.
+        """
+        today = today or datetime.utcnow().date()
+        sources = list(sources)
+        if not sources:
+            return 0
+        
+        placeholders = ", ".join("?" for _ in sources)
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                f"SELECT id, air_date FROM webinars WHERE source IN ({placeholders}) AND air_date IS NOT NULL",
+                sources,
+            ).fetchall()
+            expired = [
+                row_id for row_id, air_date in rows
+                if (until := _parse_date(air_date)) is not None and until < today
+            ]
+            
+            now = datetime.utcnow().isoformat()
+            for start in range(0, len(expired), batch_size):
+                ids = expired[start:start + batch_size]
+                id_list = ", ".join("?" for _ in ids)
+                conn.execute(f"""
+                    INSERT INTO webinars_archive
+                        (unique_id, source, title, air_date, link, last_updated, content_hash, archived_at)
+                    SELECT unique_id, source, title, air_date, link, last_updated, content_hash, ?
+                    FROM webinars WHERE id IN ({id_list})
+                    ON CONFLICT(unique_id) DO UPDATE SET
+                        title = excluded.title, air_date = excluded.air_date, link = excluded.link,
+                        last_updated = excluded.last_updated, content_hash = excluded.content_hash,
+                        archived_at = excluded.archived_at
+                """, (now, *ids))
+                conn.execute(f"""
+                    INSERT INTO webinar_changes (unique_id, op, source, title, air_date, link, changed_at)
+                    SELECT unique_id, ?, source, title, air_date, link, ?
+                    FROM webinars WHERE id IN ({id_list}) ORDER BY id
+                """, (EXPIRED, now, *ids))
+                conn.execute(f"DELETE FROM webinars WHERE id IN ({id_list})", ids)
+                conn.commit()
+        return len(expired)
+    
+    def get_archived_count(self) -> int:
+        """Get the number of archived (expired) webinars."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM webinars_archive").fetchone()[0]
     
     def get_all(self) -> List[dict]:
-        """Get all webinars."""
+        """Get all live webinars."""
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("SELECT source, title, air_date, link FROM webinars ORDER BY source, title")
             return [dict(row) for row in cursor.fetchall()]
+    
+    def iter_webinars(self, batch_size: int = 1000) -> Iterator[dict]:
+        """Stream all live webinars (with last_updated) without loading them into memory."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(
+                "SELECT source, title, air_date, link, last_updated FROM webinars ORDER BY id"
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+    
+    def iter_changes_since(self, seq: int = 0, up_to: Optional[int] = None,
+                           batch_size: int = 1000) -> Iterator[dict]:
+        """Stream change log entries with seq in (seq, up_to], oldest first."""
+        up_to = self.latest_change_seq() if up_to is None else up_to
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute("""
+                SELECT seq, op, source, title, air_date, link, changed_at
+                FROM webinar_changes WHERE seq > ? AND seq <= ? ORDER BY seq
+            """, (seq, up_to))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+    
+    def search(self, text: str, source: Optional[str] = None) -> List[dict]:
+        """Find webinars whose title contains text (case-insensitive), optionally for one source."""
+        query = "SELECT source, title, air_date, link FROM webinars WHERE title LIKE ? ESCAPE '\\'"
+        params = [_like_pattern(text)]
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        query += " ORDER BY source, title"
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def query_webinars(self, source: Optional[str] = None, date_from: Optional[str] = None,
+                       date_to: Optional[str] = None, text: Optional[str] = None,
+                       after: int = 0, limit: int = 100) -> List[dict]:
+        """
+        Get a page of live webinars in id order (keyset pagination).
+        
+        Args:
+            source: Only this provider
+            date_from: Earliest air date, YYYY-MM-DD (rows without a date are excluded)
+            date_to: Latest air date, YYYY-MM-DD
+            text: Case-insensitive title substring
+            after: Return rows with an id greater than this (the last id of the previous page)
+            limit: Page size
+        """
+        query = "SELECT id, source, title, air_date, link, last_updated FROM webinars WHERE id > ?"
+        params: list = [after]
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        if date_from:
+            query += " AND air_date_sort >= ?"
+            params.append(date_from)
+        if date_to:
+            query += " AND air_date_sort <= ?"
+            params.append(date_to)
+        if text:
+            query += " AND title LIKE ? ESCAPE '\\'"
+            params.append(_like_pattern(text))
+        query += " ORDER BY id LIMIT ?"
+        params.append(limit)
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def data_version(self) -> str:
+        """
+        Get a token that changes whenever served data changes.
+        
+        Built from the last change log seq (every insert, update and expiry)
+        and the last recorded crawl.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            seq, crawl = conn.execute("""
+                SELECT (SELECT MAX(seq) FROM webinar_changes), (SELECT MAX(last_crawl) FROM provider_stats)
+            """).fetchone()
+            return f"{seq or 0}-{crawl or ''}"
+    
+    def get_source_counts(self) -> List[dict]:
+        """
+        Get per-source statistics from provider_stats (no table scan).
+        
+        Each dict has source, total, missing_dates, min_date and max_date
+        (YYYY-MM-DD), last_updated, and last_crawl, last_yield and prev_yield
+        from record_crawl().
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute("SELECT * FROM provider_stats ORDER BY source")
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def record_crawl(self, source: str, found: int) -> Optional[int]:
+        """
+        Record a completed crawl and how many webinars it found.
+        
+        Returns the previous crawl's yield (None on the first crawl).
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO provider_stats (source, last_crawl, last_yield) VALUES (?, ?, ?)
+                ON CONFLICT (source) DO UPDATE SET
+                    prev_yield = last_yield,
+                    last_yield = excluded.last_yield,
+                    last_crawl = excluded.last_crawl
+            """, (source, datetime.utcnow().isoformat(), found))
+            conn.commit()
+            row = conn.execute("SELECT prev_yield FROM provider_stats WHERE source = ?", (source,)).fetchone()
+            return row[0]
+    
+    def changes_since(self, seq: int = 0, limit: Optional[int] = None) -> List[dict]:
+        """Get change log entries with a sequence number greater than seq, oldest first."""
+        query = """
+            SELECT seq, unique_id, op, source, title, air_date, link, changed_at
+            FROM webinar_changes WHERE seq > ? ORDER BY seq
+        """
+        params: tuple = (seq,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (seq, limit)
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def latest_change_seq(self) -> int:
+        """Get the highest sequence number in the change log (0 if empty)."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM webinar_changes")
+            return cursor.fetchone()[0]
+    
+    def get_checkpoint(self, consumer: str) -> int:
+        """Get the last sequence number a consumer has processed (0 if never synced)."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT seq FROM change_checkpoints WHERE consumer = ?", (consumer,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else 0
+    
+    def save_checkpoint(self, consumer: str, seq: int):
+        """Record that a consumer has processed all changes up to seq."""
+        now = datetime.utcnow().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO change_checkpoints (consumer, seq, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(consumer) DO UPDATE SET seq = excluded.seq, updated_at = excluded.updated_at
+            """, (consumer, seq, now))
+            conn.commit()
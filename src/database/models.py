@@ -1,21 +1,49 @@
 """
 Simplified Webinar data model.
 Only tracking: Source, Title, Air Date, Link
+
+WebinarRecord is the lightweight tuple used on the hot path (collectors,
+pipeline, DB writes, exporters). The pydantic Webinar model is kept for
+system boundaries; batches of records are validated in one call with
+validate_records(). Both live in .validation and are loaded on first use.
 """
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+import hashlib
+from typing import NamedTuple, Optional
+
+
+def make_unique_id(source: str, link: str) -> str:
+    return f"{source}::{link}"
+
+
+def make_content_hash(title: str, air_date: Optional[str]) -> str:
+    payload = f"{title}\x1f{air_date or ''}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-class Webinar(BaseModel):
-    """Simplified webinar model - On Demand only."""
+class WebinarRecord(NamedTuple):
+    """Compact webinar record - same fields as Webinar, no per-row validation."""
     
-    source: str = Field(..., description="Source provider (Syndio, WorldatWork, Pave)")
-    title: str = Field(..., description="Webinar title")
-    air_date: Optional[str] = Field(None, description="Air date as string")
-    link: str = Field(..., description="URL to webinar")
+    source: str
+    title: str
+    air_date: Optional[str]
+    link: str
     
-    # For deduplication
     @property
     def unique_id(self) -> str:
-        return f"{self.source}::{self.link}"
+        return make_unique_id(self.source, self.link)
+    
+    @property
+    def content_hash(self) -> str:
+        return make_content_hash(self.title, self.air_date)
+    
+    def to_dict(self) -> dict:
+        return self._asdict()
+
+
+def __getattr__(name):
+    # The pydantic models live in .validation so that importing this module
+    # (and DatabaseManager) does not pay for importing pydantic
+    if name in ("Webinar", "validate_records"):
+        from . import validation
+        return getattr(validation, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
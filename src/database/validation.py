@@ -0,0 +1,48 @@
+"""
+Pydantic validation for webinar data, used at system boundaries.
+
+Kept apart from models.py so that pydantic is only imported when
+validation is actually needed.
+"""
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from .models import WebinarRecord, make_content_hash, make_unique_id
+
+
+class Webinar(BaseModel):
+    """Simplified webinar model - On Demand only."""
+    
+    source: str = Field(..., description="Source provider (Syndio, WorldatWork, Pave)")
+    title: str = Field(..., description="Webinar title")
+    air_date: Optional[str] = Field(None, description="Air date as string")
+    link: str = Field(..., description="URL to webinar")
+    
+    # For deduplication
+    @property
+    def unique_id(self) -> str:
+        return make_unique_id(self.source, self.link)
+    
+    # For change detection - only fields that can change for an existing unique_id
+    @property
+    def content_hash(self) -> str:
+        return make_content_hash(self.title, self.air_date)
+
+
+_records_adapter = TypeAdapter(List[WebinarRecord])
+
+
+def validate_records(records: List[WebinarRecord]) -> Tuple[List[WebinarRecord], List[str]]:
+    """
+    Validate a batch of records in one pass.
+    
+    Returns the valid records (in order) and an error message per invalid one.
+    """
+    try:
+        return _records_adapter.validate_python(records), []
+    except ValidationError as e:
+        bad = {}
+        for error in e.errors():
+            index = error["loc"][0]
+            bad.setdefault(index, f"{'.'.join(str(p) for p in error['loc'][1:])}: {error['msg']}")
+        valid = [r for i, r in enumerate(records) if i not in bad]
+        return _records_adapter.validate_python(valid), list(bad.values())
@@ -0,0 +1,134 @@
+"""
+Sitemap-driven discovery for incremental crawling.
+
+Before a collector opens the browser, its provider's sitemaps (from
+robots.txt and the collector's SITEMAP_URLS) are streamed through lxml's
+iterparse and every webinar URL (matching SITEMAP_PATTERN) is indexed with
+its lastmod. If nothing is new or modified since the last completed crawl,
+the browser crawl is skipped; otherwise the collector runs and, once it
+completes, the index is marked as crawled.
+
+A full crawl still runs every FULL_CRAWL_DAYS in case a site's lastmod
+values are not reliable.
+
+The pending URLs only decide whether a provider is crawled at all; they are
+not handed to the collectors, so one changed URL still means a full crawl
+of that provider. Sitemap URLs are the sites' canonical pages, which do not
+match the links the collectors follow (WorldatWork's /product/redirect/
+links, Syndio and Pave listing cards), so there is no reliable way to
+narrow a crawl down to them.
+"""
+import gzip
+import logging
+import re
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import IO, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from .database.db_manager import DatabaseManager
+from .utils.politeness import PolitenessScheduler, get_scheduler
+
+FULL_CRAWL_DAYS = 7
+MAX_SITEMAPS = 50
+
+logger = logging.getLogger("discovery")
+
+
+def iter_sitemap(stream: IO[bytes]) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Stream-parse a sitemap or sitemap index.
+    
+    Yields ("url" or "sitemap", loc, lastmod) without building the whole tree.
+    """
+    for _, elem in etree.iterparse(stream, events=("end",), recover=True, huge_tree=True):
+        kind = etree.QName(elem).localname
+        if kind in ("url", "sitemap"):
+            loc = lastmod = None
+            for child in elem:
+                name = etree.QName(child).localname
+                if name == "loc":
+                    loc = (child.text or "").strip()
+                elif name == "lastmod":
+                    lastmod = (child.text or "").strip() or None
+            if loc:
+                yield kind, loc, lastmod
+            # Free parsed elements as we go
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+class SitemapDiscovery:
+    """Decides from the sitemaps whether a collector needs to crawl."""
+    
+    def __init__(self, db: DatabaseManager, scheduler: Optional[PolitenessScheduler] = None):
+        self.db = db
+        self.scheduler = scheduler or get_scheduler()
+        self.failed = 0
+    
+    @contextmanager
+    def _open(self, url: str) -> Iterator[IO[bytes]]:
+        response = self.scheduler.request("GET", url, stream=True)
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            if url.endswith(".gz"):
+                yield gzip.GzipFile(fileobj=response.raw)
+            else:
+                yield response.raw
+        finally:
+            response.close()
+    
+    def _entries(self, roots: List[str], pattern: re.Pattern) -> Iterator[Tuple[str, Optional[str]]]:
+        """Walk the sitemaps (following indexes) and yield matching (url, lastmod)."""
+        queue, seen = list(roots), set()
+        while queue and len(seen) < MAX_SITEMAPS:
+            sitemap = queue.pop(0)
+            if sitemap in seen:
+                continue
+            seen.add(sitemap)
+            try:
+                with self._open(sitemap) as stream:
+                    for kind, loc, lastmod in iter_sitemap(stream):
+                        if kind == "sitemap":
+                            queue.append(loc)
+                        elif pattern.search(loc):
+                            yield loc, lastmod
+            except Exception as e:
+                logger.warning(f"Could not read sitemap {sitemap}: {e}")
+                self.failed += 1
+    
+    def pending(self, collector) -> Optional[List[str]]:
+        """
+        Index a collector's sitemaps and get its new or modified webinar URLs.
+        
+        Callers use the result to decide whether to crawl, not what to crawl
+        (see the module docstring).
+        
+        Returns None when the crawl must run regardless: a sitemap could not
+        be read or had no webinar URLs, the collector has no SITEMAP_PATTERN,
+        or the last full crawl is older than FULL_CRAWL_DAYS.
+        """
+        if not collector.SITEMAP_PATTERN:
+            return None
+        
+        roots = self.scheduler.sitemaps_for(collector.URL)
+        roots += [u for u in collector.SITEMAP_URLS if u not in roots]
+        self.failed = 0
+        count = self.db.update_sitemap(
+            collector.SOURCE_NAME, self._entries(roots, re.compile(collector.SITEMAP_PATTERN))
+        )
+        if count == 0 or self.failed:
+            return None
+        
+        last_crawl = self.db.last_sitemap_crawl(collector.SOURCE_NAME)
+        full_crawl_due = datetime.utcnow() - timedelta(days=FULL_CRAWL_DAYS)
+        if last_crawl is None or datetime.fromisoformat(last_crawl) < full_crawl_due:
+            return None
+        return self.db.pending_sitemap_urls(collector.SOURCE_NAME)
+    
+    def mark_crawled(self, collector):
+        """Record that the collector completed a crawl covering the indexed URLs."""
+        self.db.mark_sitemap_crawled(collector.SOURCE_NAME)
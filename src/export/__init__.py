@@ -1,4 +1,13 @@
 """Export modules."""
-from .coda import CodaExporter, export_to_coda
+from .base import ExportSink
+from .files import FILE_FORMATS, export_file
 
-__all__ = ["CodaExporter", "export_to_coda"]
+__all__ = ["ExportSink", "CodaExporter", "CodaSink", "export_to_coda", "FILE_FORMATS", "export_file"]
+
+
+def __getattr__(name):
+    # The Coda exporter pulls in requests; load it only when used
+    if name in ("CodaExporter", "CodaSink", "export_to_coda"):
+        from . import coda
+        return getattr(coda, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
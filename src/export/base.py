@@ -0,0 +1,19 @@
+"""
+Base class for export sinks fed by the collection pipeline.
+"""
+from typing import List, Optional
+
+from ..database.models import WebinarRecord
+
+
+class ExportSink:
+    """Destination for written records. Receives batches in pipeline order."""
+    
+    name: str = "sink"
+    
+    def write(self, records: List[WebinarRecord]):
+        raise NotImplementedError
+    
+    def close(self) -> Optional[dict]:
+        """Finish the export. Returns a result dict for the run summary."""
+        return None
@@ -7,14 +7,20 @@ Requires:
 - CODA_TABLE_ID: The table ID or table name
 """
 import os
+import time
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from ..database.models import WebinarRecord
+from .base import ExportSink
 
 
 class CodaExporter:
     """Export webinar data to a Coda table."""
     
     BASE_URL = "https://coda.io/apis/v1"
+    # Coda API allows up to 500 rows per request
+    MAX_ROWS_PER_REQUEST = 500
     
     def __init__(self):
         self.api_token = os.environ.get("CODA_API_TOKEN")
@@ -83,8 +89,6 @@ class CodaExporter:
         - Air Date
         - Link
         """
-        url = f"{self.BASE_URL}/docs/{self.doc_id}/tables/{self.table_id}/rows"
-        
         # First, verify we can access the table
         print(f"  Using Doc ID: {self.doc_id}")
         print(f"  Using Table ID: {self.table_id}")
@@ -98,9 +102,16 @@ class CodaExporter:
         if not new_webinars:
             return {"inserted": 0, "message": "No new webinars to add"}
         
+        total_inserted = self.insert_rows(new_webinars)
+        return {"inserted": total_inserted, "message": f"Added {total_inserted} new webinars"}
+    
+    def insert_rows(self, webinars: List[Dict]) -> int:
+        """Insert webinars as new rows, in order. Returns the number of rows sent."""
+        url = f"{self.BASE_URL}/docs/{self.doc_id}/tables/{self.table_id}/rows"
+        
         # Format rows for Coda API
         rows = []
-        for w in new_webinars:
+        for w in webinars:
             rows.append({
                 "cells": [
                     {"column": "Source", "value": w.get("source", "")},
@@ -110,22 +121,19 @@ class CodaExporter:
                 ]
             })
         
-        # Coda API allows up to 500 rows per request
-        batch_size = 500
         total_inserted = 0
         
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i:i + batch_size]
+        for i in range(0, len(rows), self.MAX_ROWS_PER_REQUEST):
+            batch = rows[i:i + self.MAX_ROWS_PER_REQUEST]
             payload = {"rows": batch}
             
             response = requests.post(url, headers=self.headers, json=payload)
             response.raise_for_status()
             
-            result = response.json()
             total_inserted += len(batch)
             print(f"  Inserted batch of {len(batch)} rows")
         
-        return {"inserted": total_inserted, "message": f"Added {total_inserted} new webinars"}
+        return total_inserted
 
 
 def export_to_coda(webinars: List[Dict]) -> Dict:
@@ -140,3 +148,55 @@ def export_to_coda(webinars: List[Dict]) -> Dict:
     """
     exporter = CodaExporter()
     return exporter.upsert_rows(webinars)
+
+
+class CodaSink(ExportSink):
+    """
+    Pipeline sink that exports written webinars to Coda while scraping continues.
+    
+    Runs in the pipeline's export thread. Existing Coda links are fetched once
+    on the first batch; new rows are then sent in pipeline order whenever
+    batch_size rows are buffered or max_delay seconds have passed since the
+    oldest buffered row. close() only flushes what is left.
+    """
+    
+    name = "coda"
+    
+    def __init__(self, batch_size: int = 100, max_delay: float = 30.0):
+        self.exporter = CodaExporter()
+        self.batch_size = min(batch_size, CodaExporter.MAX_ROWS_PER_REQUEST)
+        self.max_delay = max_delay
+        self.existing_links: Optional[set] = None
+        self.buffer: List[Dict] = []
+        self.buffered_since = 0.0
+        self.inserted = 0
+    
+    def write(self, records: List[WebinarRecord]):
+        if self.existing_links is None:
+            self.existing_links = self.exporter.get_existing_links()
+        
+        for r in records:
+            if r.link in self.existing_links:
+                continue
+            self.existing_links.add(r.link)
+            if not self.buffer:
+                self.buffered_since = time.monotonic()
+            self.buffer.append(r.to_dict())
+        
+        if len(self.buffer) >= self.batch_size or (
+            self.buffer and time.monotonic() - self.buffered_since >= self.max_delay
+        ):
+            self._flush()
+    
+    def _flush(self):
+        while self.buffer:
+            batch = self.buffer[:self.batch_size]
+            self.inserted += self.exporter.insert_rows(batch)
+            # Only drop rows once Coda has accepted them
+            del self.buffer[:len(batch)]
+    
+    def close(self) -> Optional[Dict]:
+        self._flush()
+        if not self.inserted:
+            return {"inserted": 0, "message": "No new webinars to add"}
+        return {"inserted": self.inserted, "message": f"Added {self.inserted} new webinars"}
@@ -0,0 +1,152 @@
+"""
+Bulk file export of the webinar database for analysts.
+
+Formats:
+- csv / jsonl: streamed row by row, optionally compressed (gzip, bz2, xz)
+- parquet: columnar, written in record batches (requires pyarrow; codecs
+  snappy, gzip, zstd, ...)
+
+Full exports stream the webinars table. Incremental exports (since_last)
+stream the change log from the consumer's checkpoint, which is only
+advanced once the file has been written completely.
+"""
+import bz2
+import csv
+import gzip
+import json
+import lzma
+from pathlib import Path
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+from ..database.db_manager import DatabaseManager
+
+FILE_FORMATS = ("csv", "jsonl", "parquet")
+
+FULL_COLUMNS = ["source", "title", "air_date", "link", "last_updated"]
+CHANGE_COLUMNS = ["seq", "op", "source", "title", "air_date", "link", "changed_at"]
+
+PARQUET_CODECS = ("none", "snappy", "gzip", "brotli", "lz4", "zstd")
+
+_TEXT_OPENERS = {
+    None: open,
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+
+def _open_text(path: Path, compression: Optional[str]) -> IO[str]:
+    if compression not in _TEXT_OPENERS:
+        raise ValueError(f"Unsupported compression for text formats: {compression}")
+    return _TEXT_OPENERS[compression](path, "wt", encoding="utf-8", newline="")
+
+
+def write_csv(rows: Iterable[dict], path: Path, columns: List[str],
+              compression: Optional[str] = None) -> int:
+    """Stream rows to a CSV file. Returns the number of rows written."""
+    count = 0
+    with _open_text(path, compression) as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[dict], path: Path, columns: List[str],
+                compression: Optional[str] = None) -> int:
+    """Stream rows to a JSON Lines file. Returns the number of rows written."""
+    count = 0
+    with _open_text(path, compression) as f:
+        for row in rows:
+            f.write(json.dumps({c: row.get(c) for c in columns}, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _batched(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_parquet(rows: Iterable[dict], path: Path, columns: List[str],
+                  compression: Optional[str] = None, batch_size: int = 10000) -> int:
+    """Write rows to Parquet in record batches. Returns the number of rows written."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+    
+    compression = compression or "snappy"
+    if compression not in PARQUET_CODECS:
+        raise ValueError(f"Unsupported compression for parquet: {compression} "
+                         f"(use one of {', '.join(PARQUET_CODECS)})")
+    if compression != "none" and not pa.Codec.is_available(compression):
+        raise ValueError(f"This pyarrow build does not support {compression} compression")
+    
+    schema = pa.schema([
+        (c, pa.int64() if c == "seq" else pa.string()) for c in columns
+    ])
+    count = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for batch in _batched(rows, batch_size):
+            table = pa.Table.from_pylist(batch, schema=schema)
+            writer.write_table(table)
+            count += len(batch)
+        if count == 0:
+            writer.write_table(schema.empty_table())
+    return count
+
+
+_WRITERS = {
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+    "parquet": write_parquet,
+}
+
+
+def export_file(db: DatabaseManager, fmt: str, path: str, since_last: bool = False,
+                compression: Optional[str] = None, consumer: Optional[str] = None) -> Dict:
+    """
+    Export the database to a file.
+    
+    Args:
+        db: Database to read from
+        fmt: One of FILE_FORMATS
+        path: Output file path
+        since_last: Only export changes since this consumer's last export
+        compression: gzip/bz2/xz for csv and jsonl, a Parquet codec for parquet
+        consumer: Checkpoint name for incremental mode (default "export-<fmt>")
+    
+    Returns:
+        Result dict with row count
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    writer = _WRITERS[fmt]
+    
+    if not since_last:
+        rows = writer(db.iter_webinars(), output, FULL_COLUMNS, compression)
+        return {"rows": rows, "message": f"Exported {rows} webinars to {output}"}
+    
+    consumer = consumer or f"export-{fmt}"
+    start = db.get_checkpoint(consumer)
+    # Pin the upper bound so changes written during the export are left for next time
+    end = db.latest_change_seq()
+    rows = writer(db.iter_changes_since(start, up_to=end), output, CHANGE_COLUMNS, compression)
+    db.save_checkpoint(consumer, end)
+    if not rows:
+        return {"rows": 0, "message": f"No changes since seq {start} (wrote empty {output})"}
+    return {"rows": rows, "message": f"Exported {rows} changes (seq {start + 1}-{end}) to {output}"}
@@ -1,31 +1,219 @@
 """
 Main entry point for the Webinar Aggregation Agent.
 Supports export to Coda when CODA_API_TOKEN is set.
+
+Usage:
+    python src/main.py [collect]                  Run all collectors (default)
+    python src/main.py export                     Export the database to Coda
+    python src/main.py export --format parquet    Bulk export to CSV/JSONL/Parquet
+    python src/main.py report                     Per-source counts and DB contents
+    python src/main.py search TEXT [--source S]   Find webinars by title
+    python src/main.py reparse [--source S]       Re-extract webinars from the page archive
+    python src/main.py collect --shard 2/3        Run one shard of a sharded collection
+    python src/main.py collect --profile [--trace]  Profile each collector (see profiling.py)
+    python src/main.py merge SHARD.db ...         Merge shard DBs into --db
+    python src/main.py prune                      Archive webinars past their "until" date
+    python src/main.py serve [--port 8000]        Read-only HTTP query service (see service.py)
+    python src/main.py check-imports              Check CLI start-up import time
+
+Heavy modules (Playwright, pydantic, requests) are only imported by the
+commands that need them, so report, search and export start quickly.
 """
+import argparse
 import os
+import subprocess
 import sys
+import time
+from contextlib import nullcontext
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
 
-from src.collectors.syndio import SyndioCollector
-from src.collectors.worldatwork import WorldatWorkCollector
-from src.collectors.pave import PaveCollector
 from src.database.db_manager import DatabaseManager
-from src.database.models import Webinar
+
+# Modules that must not be loaded just by importing the CLI
+HEAVY_MODULES = ("playwright", "pydantic", "requests")
+IMPORT_BUDGET_MS = 100
+
+# Whole-run time budget for collect; leaves headroom under the CI job timeout
+RUN_BUDGET_MINUTES = 45
+# Extra time after the run deadline for the pipeline to drain and export
+CLOSE_GRACE_SECONDS = 120
+# A completed crawl finding less than this share of the previous crawl's webinars is flagged
+YIELD_DROP_RATIO = 0.5
+
+
+def run_collector(pipeline, db: DatabaseManager, collector, deadline: float = None,
+                  discovery=None, shard=None, profiler=None) -> int:
+    """
+    Run a collector, streaming its results through the pipeline.
+    
+    Each batch is written in the same transaction as the collector's
+    checkpoint, so an interrupted or over-budget run resumes from its last
+    committed batch. Pages that failed to load go into the retry queue.
+    
+    With sitemap discovery, the crawl is skipped when the provider's sitemap
+    shows no new or modified webinars and nothing is left to resume or retry.
+    On a shard, providers owned by another shard are skipped. With a
+    profiler, the run is profiled (cProfile, tracemalloc, Playwright trace).
+    """
+    collector.shard = shard
+    if pipeline.error is not None:
+        print(f"  ↷ Skipped: the pipeline failed ({pipeline.error})")
+        return 0
+    if not collector.SHARD_BY_ITEM and not collector.owns(collector.SOURCE_NAME):
+        print("  ↷ Skipped: assigned to another shard")
+        return 0
+    
+    resume_state = db.get_run_state(collector.SOURCE_NAME)
+    if resume_state:
+        print("  (Resuming from checkpoint of an interrupted run)")
+    
+    if discovery is not None:
+        pending = discovery.pending(collector)
+        if pending is None:
+            print("  (Sitemap discovery: full crawl)")
+        elif pending or resume_state or db.get_retry_links(collector.SOURCE_NAME):
+            print(f"  (Sitemap discovery: {len(pending)} new or modified webinar URLs)")
+        else:
+            print("  ↷ Skipped: no sitemap changes since the last crawl")
+            return 0
+    
+    collector.strategies.load(db.get_strategies(collector.SOURCE_NAME))
+    with profiler.profile(collector) if profiler else nullcontext():
+        count = pipeline.run_collector(collector, resume_state=resume_state, deadline=deadline)
+    if collector.over_budget:
+        print(f"  ⏱ Stopped after {collector.elapsed:.0f}s (time budget); partial results kept")
+    
+    db.save_fetch_results(collector.SOURCE_NAME, collector.failed, collector.fetched)
+    db.save_strategies(collector.SOURCE_NAME, collector.strategies.rows())
+    if collector.completed:
+        previous = db.record_crawl(collector.SOURCE_NAME, collector.listed)
+        if yield_dropped(collector.listed, previous):
+            print(f"  ⚠ Found {collector.listed} webinars on the listings, down from {previous} last crawl")
+        if discovery is not None:
+            discovery.mark_crawled(collector)
+    if collector.failed:
+        print(f"  ⚠ {len(collector.failed)} page(s) failed to load; queued for retry next run")
+    return count
+
+
+def yield_dropped(found: int, previous) -> bool:
+    """Whether a crawl found suddenly fewer webinars than the one before."""
+    return bool(previous) and found < previous * YIELD_DROP_RATIO
+
+
+def print_provider_stats(db: DatabaseManager):
+    """Print the per-source statistics kept in provider_stats."""
+    print(f"{'SOURCE':12} | {'TOTAL':>6} | {'NO DATE':>7} | {'DATES':23} | {'FOUND':>6} | LAST CRAWL")
+    print("-" * 90)
+    for row in db.get_source_counts():
+        dates = f"{row['min_date']} – {row['max_date']}" if row["min_date"] else "N/A"
+        found = "" if row["last_yield"] is None else str(row["last_yield"])
+        crawl = (row["last_crawl"] or "never")[:19]
+        if row["last_yield"] is not None and yield_dropped(row["last_yield"], row["prev_yield"]):
+            crawl += f"  ⚠ down from {row['prev_yield']}"
+        print(f"{row['source']:12} | {row['total']:6} | {row['missing_dates']:7} | {dates:23} | {found:>6} | {crawl}")
+
+
+def print_budget_report(collectors: list, run_budget: float):
+    """Print how long each collector took against its budget."""
+    print(f"\n{'COLLECTOR':12} | {'ELAPSED':>8} | {'BUDGET':>8} | STATUS")
+    print("-" * 50)
+    for c in collectors:
+        if c.over_budget:
+            status = "over budget"
+        elif c.completed:
+            status = "ok"
+        else:
+            status = "incomplete" if c.elapsed else "skipped"
+        print(f"{c.SOURCE_NAME:12} | {c.elapsed:7.0f}s | {c.TIME_BUDGET:7.0f}s | {status}")
+    total = sum(c.elapsed for c in collectors)
+    print(f"{'Total':12} | {total:7.0f}s | {run_budget:7.0f}s |")
+
+
+def archive_expired(db: DatabaseManager) -> int:
+    """Move webinars whose "available until" date has passed to the archive table."""
+    from src.collectors import PaveCollector, SyndioCollector, WorldatWorkCollector
+    
+    sources = [
+        c.SOURCE_NAME for c in (SyndioCollector, WorldatWorkCollector, PaveCollector) if c.AIR_DATE_IS_EXPIRY
+    ]
+    archived = db.archive_expired(sources)
+    if archived:
+        print(f"  ✓ Archived {archived} expired webinars")
+    return archived
+
+
+def print_contents(db: DatabaseManager):
+    """Print every webinar in the database."""
+    print("\nDatabase Contents:")
+    print("-" * 100)
+    print(f"{'SOURCE':12} | {'AIR DATE':20} | TITLE")
+    print("-" * 100)
+    
+    for w in db.get_all():
+        date = w["air_date"][:20] if w["air_date"] else "N/A"
+        print(f"{w['source']:12} | {date:20} | {w['title'][:50]}")
 
 
-def main():
+def prune_page_archive():
+    """Trim the page archive (if archiving is on) to its newest snapshots per URL."""
+    from src.archive import get_archive, get_keep
+    
+    archive = get_archive()
+    if archive is None:
+        return
+    dropped, deleted = archive.prune(get_keep())
+    if dropped or deleted:
+        print(f"  ✓ Pruned {dropped} old page snapshots ({deleted} files)")
+
+
+def cmd_collect(args) -> int:
     """Run all collectors and update the database."""
+    from src.collectors.syndio import SyndioCollector
+    from src.collectors.worldatwork import WorldatWorkCollector
+    from src.collectors.pave import PaveCollector
+    from src.pipeline import Pipeline
+    from src.utils.logger import setup_logging
+    
+    run_id = setup_logging()
+    db = DatabaseManager(args.db)
     print("=" * 60)
     print("Webinar Aggregation Agent")
+    print(f"Run {run_id}")
     print("=" * 60)
     
-    db = DatabaseManager()
-    all_webinars = []
+    # Export to Coda if credentials are set - runs alongside scraping
+    sinks = []
+    if os.environ.get("CODA_API_TOKEN"):
+        try:
+            from src.export.coda import CodaSink
+            sinks.append(CodaSink())
+        except Exception as e:
+            print(f"  ✗ Coda export disabled: {e}")
     
-    total_inserted = 0
-    total_updated = 0
+    pipeline = Pipeline(db, sinks=sinks)
+    shard = args.shard
+    if shard is not None:
+        print(f"Shard {shard}")
+        item_sources = [
+            c.SOURCE_NAME for c in (SyndioCollector, WorldatWorkCollector, PaveCollector) if c.SHARD_BY_ITEM
+        ]
+        db.save_shard_info(shard.index, shard.count, item_sources)
+    
+    discovery = None
+    if args.discover:
+        from src.discovery import SitemapDiscovery
+        discovery = SitemapDiscovery(db)
+    profiler = None
+    if args.profile or args.trace:
+        from src.profiling import PROFILE_DIR, RunProfiler
+        profiler = RunProfiler(args.profile or PROFILE_DIR, trace=args.trace)
+        print(f"Profiling to {profiler.dir}")
+    run_budget = args.run_budget * 60
+    deadline = time.monotonic() + run_budget
     
     # Syndio - pass existing links to skip duplicates
     print(f"\n{'─' * 40}")
@@ -33,17 +221,10 @@ def main():
     syndio_existing = db.get_existing_links("Syndio")
     print(f"  (Found {len(syndio_existing)} existing entries in DB)")
     syndio_collector = SyndioCollector(existing_links=syndio_existing)
-    syndio_results = syndio_collector.run()
-    
-    if syndio_results:
-        for r in syndio_results:
-            webinar = Webinar(source=r["source"], title=r["title"], air_date=r.get("air_date"), link=r["link"])
-            if db.upsert_webinar(webinar):
-                total_inserted += 1
-            else:
-                total_updated += 1
-            all_webinars.append(r)
-        print(f"  ✓ Collected {len(syndio_results)} webinars")
+    syndio_count = run_collector(pipeline, db, syndio_collector, deadline, discovery, shard, profiler)
+    
+    if syndio_count:
+        print(f"  ✓ Collected {syndio_count} webinars")
     else:
         print(f"  ✗ No new webinars found")
     
@@ -51,19 +232,15 @@ def main():
     print(f"\n{'─' * 40}")
     print(f"Running WorldatWork...")
     waw_existing = db.get_existing_links("WorldatWork")
-    print(f"  (Found {len(waw_existing)} existing entries in DB)")
+    waw_retry = db.get_retry_links("WorldatWork")
+    print(f"  (Found {len(waw_existing)} existing entries in DB, {len(waw_retry)} to retry)")
+    # Detail pages that failed last time are fetched again even though the link exists
+    waw_existing -= waw_retry
     waw_collector = WorldatWorkCollector(existing_links=waw_existing)
-    waw_results = waw_collector.run()
-    
-    if waw_results:
-        for r in waw_results:
-            webinar = Webinar(source=r["source"], title=r["title"], air_date=r.get("air_date"), link=r["link"])
-            if db.upsert_webinar(webinar):
-                total_inserted += 1
-            else:
-                total_updated += 1
-            all_webinars.append(r)
-        print(f"  ✓ Collected {len(waw_results)} webinars")
+    waw_count = run_collector(pipeline, db, waw_collector, deadline, discovery, shard, profiler)
+    
+    if waw_count:
+        print(f"  ✓ Collected {waw_count} webinars")
     else:
         print(f"  ✗ No new webinars found")
     
@@ -71,47 +248,296 @@ def main():
     print(f"\n{'─' * 40}")
     print(f"Running Pave...")
     pave_collector = PaveCollector()
-    pave_results = pave_collector.run()
-    
-    if pave_results:
-        for r in pave_results:
-            webinar = Webinar(source=r["source"], title=r["title"], air_date=r.get("air_date"), link=r["link"])
-            if db.upsert_webinar(webinar):
-                total_inserted += 1
-            else:
-                total_updated += 1
-            all_webinars.append(r)
-        print(f"  ✓ Collected {len(pave_results)} webinars")
+    pave_count = run_collector(pipeline, db, pave_collector, deadline, discovery, shard, profiler)
+    
+    if pave_count:
+        print(f"  ✓ Collected {pave_count} webinars")
     else:
         print(f"  ✗ No webinars found")
     
+    # Wait for pending DB writes and exports
+    try:
+        drained = pipeline.close(deadline=max(deadline, time.monotonic()) + CLOSE_GRACE_SECONDS)
+    except Exception as e:
+        print(f"  ✗ Pipeline failed: {e}; results after the last committed batch were not saved")
+        drained = False
+    
+    print_budget_report([syndio_collector, waw_collector, pave_collector], run_budget)
+    prune_page_archive()
+    if not drained and pipeline.error is None:
+        print("  ⏱ Pipeline did not finish writing within the run budget; exports skipped")
+    elif drained:
+        archive_expired(db)
+    print()
+    print_provider_stats(db)
+    if profiler:
+        print(f"\n  ✓ Profile written to {profiler.close() / 'summary.txt'}")
+    
     print(f"\n{'=' * 60}")
-    print(f"Complete! Inserted: {total_inserted}, Updated: {total_updated}")
+    print(f"Complete! Inserted: {pipeline.inserted}, Updated: {pipeline.updated}, Unchanged: {pipeline.unchanged}")
+    if pipeline.invalid or pipeline.duplicates:
+        print(f"Dropped: {pipeline.invalid} invalid, {pipeline.duplicates} duplicates")
     print("=" * 60)
     
-    # Export to Coda if credentials are set
-    if os.environ.get("CODA_API_TOKEN"):
-        print("\n" + "─" * 40)
-        print("Exporting to Coda...")
+    for name, result in pipeline.sink_results.items():
+        if result and "error" in result:
+            print(f"  ✗ {name} export failed: {result['error']}")
+        elif result:
+            print(f"  ✓ {name}: {result['message']}")
+    
+    print_contents(db)
+    return 1 if pipeline.error is not None else 0
+
+
+def cmd_export(args) -> int:
+    """Export the database to Coda or to a CSV/JSONL/Parquet file."""
+    db = DatabaseManager(args.db)
+    if args.format != "coda":
+        from src.export.files import export_file
+        
+        output = args.output or f"data/export/webinars.{args.format}"
         try:
-            from src.export.coda import export_to_coda
-            result = export_to_coda(all_webinars)
-            print(f"  ✓ {result['message']}")
-        except Exception as e:
-            print(f"  ✗ Coda export failed: {e}")
+            result = export_file(db, args.format, output, since_last=args.since_last,
+                                 compression=args.compress, consumer=args.consumer)
+        except (ImportError, ValueError) as e:
+            print(f"  ✗ Export failed: {e}")
+            return 1
+        print(f"  ✓ {result['message']}")
+        return 0
     
-    # Show database contents
-    print("\nDatabase Contents:")
-    print("-" * 100)
-    print(f"{'SOURCE':12} | {'AIR DATE':20} | TITLE")
-    print("-" * 100)
+    from src.export.coda import export_to_coda
     
-    for w in db.get_all():
+    print("Exporting to Coda...")
+    try:
+        result = export_to_coda(db.get_all())
+    except Exception as e:
+        print(f"  ✗ Coda export failed: {e}")
+        return 1
+    print(f"  ✓ {result['message']}")
+    return 0
+
+
+def cmd_report(args) -> int:
+    """Show per-source statistics, then the database contents."""
+    db = DatabaseManager(args.db)
+    print_provider_stats(db)
+    archived = db.get_archived_count()
+    if archived:
+        print(f"{'(archived)':12} | {archived:6} | expired, not shown")
+    
+    if not args.summary:
+        print_contents(db)
+    return 0
+
+
+def cmd_search(args) -> int:
+    """Find webinars whose title contains the search text."""
+    db = DatabaseManager(args.db)
+    results = db.search(args.text, source=args.source)
+    for w in results:
         date = w["air_date"][:20] if w["air_date"] else "N/A"
-        print(f"{w['source']:12} | {date:20} | {w['title'][:50]}")
+        print(f"{w['source']:12} | {date:20} | {w['title'][:50]} | {w['link']}")
+    print(f"\n{len(results)} match(es)")
+    return 0
+
+
+def cmd_reparse(args) -> int:
+    """Re-run the current extractors over the archived pages."""
+    from src.archive import PageArchive
+    from src.reparse import reparse
+    from src.utils.logger import setup_logging
+    
+    setup_logging()
+    root = args.archive or os.environ.get("PAGE_ARCHIVE_DIR") or "data/archive"
+    if not (Path(root) / "index.db").exists():
+        print(f"  ✗ No page archive at {root} (collect with PAGE_ARCHIVE_DIR set first)")
+        return 1
+    
+    db = DatabaseManager(args.db)
+    summary = reparse(db, PageArchive(root), source=args.source, workers=args.workers)
+    if not summary:
+        print("  ✗ No archived pages to reparse")
+        return 1
+    for source, result in summary.items():
+        print(f"  ✓ {source}: {result['records']} webinars from {result['pages']} pages "
+              f"(inserted {result['inserted']}, updated {result['updated']}, "
+              f"unchanged {result['unchanged']}, invalid {result['invalid']}, "
+              f"skipped {result['archived']} expired)")
+    return 0
+
+
+def cmd_merge(args) -> int:
+    """Merge shard DBs into the --db database."""
+    from src.sharding import merge_shards
+    
+    missing = [p for p in args.shards if not Path(p).exists()]
+    if missing:
+        print(f"  ✗ Shard DB not found: {', '.join(missing)}")
+        return 1
+    db = DatabaseManager(args.db)
+    try:
+        results = merge_shards(db, args.shards)
+    except ValueError as e:
+        print(f"  ✗ Merge failed: {e}")
+        return 1
+    for result in results:
+        print(f"  ✓ {result['path']}: {result['webinars']} webinars, {result['changes']} changes merged")
+    archive_expired(db)
+    return 0
+
+
+def cmd_prune(args) -> int:
+    """Archive expired webinars."""
+    db = DatabaseManager(args.db)
+    if not archive_expired(db):
+        print("  ✓ No expired webinars")
+    return 0
+
+
+def cmd_serve(args) -> int:
+    """Serve read-only queries over HTTP until interrupted."""
+    from src.service import make_server
     
+    if not Path(args.db).exists():
+        print(f"  ✗ No database at {args.db} (run collect first)")
+        return 1
+    # Read-only: leave schema changes to the commands that write
+    db = DatabaseManager(args.db, init=False)
+    server = make_server(db, args.host, args.port, cache_size=args.cache_size)
+    print(f"Serving {db.db_path} on http://{args.host}:{server.server_port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
     return 0
 
 
+def cmd_check_imports(args) -> int:
+    """Fail if importing the CLI loads heavy modules or exceeds the time budget."""
+    probe = (
+        "import sys; import src.main; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr)
+        return 1
+    
+    # Lines look like "import time:  self [us] | cumulative | package"
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented after the single separating space
+        timings.append((int(cumulative), name[1:].rstrip()))
+    
+    total_ms = next((us for us, name in timings if name == "src.main"), 0) / 1000
+    heavy = [m for m in proc.stdout.strip().split(",") if m]
+    
+    print(f"Importing the CLI took {total_ms:.1f} ms (budget {args.budget_ms} ms)")
+    print("Slowest top-level imports:")
+    for us, name in sorted((t for t in timings if not t[1].startswith(" ")), reverse=True)[:5]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    
+    ok = True
+    if heavy:
+        print(f"  ✗ Heavy modules loaded at start-up: {', '.join(heavy)}")
+        ok = False
+    if total_ms > args.budget_ms:
+        print(f"  ✗ Over budget by {total_ms - args.budget_ms:.1f} ms")
+        ok = False
+    if ok:
+        print("  ✓ Within budget")
+    return 0 if ok else 1
+
+
+def shard_arg(value: str):
+    from src.sharding import parse_shard
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Webinar Aggregation Agent")
+    parser.add_argument("--db", default="data/webinars.db", help="SQLite database path")
+    # collect is the default command, so its options need defaults without the subcommand
+    parser.set_defaults(run_budget=RUN_BUDGET_MINUTES, discover=False, shard=None, profile=None, trace=False)
+    sub = parser.add_subparsers(dest="command")
+    
+    collect = sub.add_parser("collect", help="Run all collectors (default)")
+    collect.add_argument("--run-budget", type=float, default=RUN_BUDGET_MINUTES,
+                         help=f"Time budget for the whole run in minutes (default {RUN_BUDGET_MINUTES})")
+    collect.add_argument("--discover", action="store_true",
+                         help="Check sitemaps first and only crawl providers with new or modified webinars")
+    collect.add_argument("--shard", type=shard_arg, metavar="I/N",
+                         help="Only run shard I of N (write each shard to its own --db, then merge)")
+    collect.add_argument("--profile", nargs="?", const="data/profiles", metavar="DIR",
+                         help="Profile each collector (cProfile, tracemalloc) into a new directory under DIR "
+                              "(default data/profiles)")
+    collect.add_argument("--trace", action="store_true",
+                         help="Profile and also record a Playwright trace per collector")
+    export = sub.add_parser("export", help="Export the database to Coda or a file")
+    export.add_argument("--format", choices=["coda", "csv", "jsonl", "parquet"], default="coda")
+    export.add_argument("--output", help="Output file (default data/export/webinars.<format>)")
+    export.add_argument("--since-last", action="store_true",
+                        help="Only export changes since the previous export (file formats)")
+    export.add_argument("--compress", help="gzip/bz2/xz for csv and jsonl; snappy/gzip/zstd for parquet")
+    export.add_argument("--consumer", help="Checkpoint name for --since-last (default export-<format>)")
+    
+    report = sub.add_parser("report", help="Show per-source counts and DB contents")
+    report.add_argument("--summary", action="store_true", help="Only show per-source counts")
+    
+    search = sub.add_parser("search", help="Find webinars by title")
+    search.add_argument("text")
+    search.add_argument("--source", help="Limit to one provider")
+    
+    reparse = sub.add_parser("reparse", help="Re-extract webinars from the page archive")
+    reparse.add_argument("--source", help="Limit to one provider")
+    reparse.add_argument("--archive", help="Archive directory (default $PAGE_ARCHIVE_DIR or data/archive)")
+    reparse.add_argument("--workers", type=int, help="Worker processes (default: one per CPU core)")
+    
+    merge = sub.add_parser("merge", help="Merge shard DBs into --db")
+    merge.add_argument("shards", nargs="+", help="Shard DB files")
+    
+    sub.add_parser("prune", help="Archive webinars past their \"until\" date")
+    
+    serve = sub.add_parser("serve", help="Serve read-only queries over HTTP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--cache-size", type=int, default=256, help="Responses kept in the LRU cache")
+    
+    check = sub.add_parser("check-imports", help="Check CLI start-up import time")
+    check.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    
+    return parser
+
+
+COMMANDS = {
+    "collect": cmd_collect,
+    "export": cmd_export,
+    "report": cmd_report,
+    "search": cmd_search,
+    "reparse": cmd_reparse,
+    "merge": cmd_merge,
+    "prune": cmd_prune,
+    "serve": cmd_serve,
+    "check-imports": cmd_check_imports,
+}
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    command = args.command or "collect"
+    return COMMANDS[command](args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Streaming collection pipeline.
+
+Collectors run in the calling thread (Playwright's sync API is not thread
+safe) and hand over small batches. Everything after scraping runs in
+background stages connected by bounded queues, so DB writes and exports
+overlap with scraping and memory stays flat:
+
+    collector -> validate -> dedup -> DB writer -> export sinks
+
+A full queue blocks the stage feeding it, which throttles the scraper
+rather than buffering without limit.
+
+The DB writer retries a batch that hits a locked database. If a stage
+still fails, the next batch the collector hands over raises
+PipelineError, so the collector stops (keeping the checkpoint of the last
+committed batch) instead of scraping on into a pipeline that drops
+everything.
+"""
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+from .database.db_manager import DatabaseManager
+from .database.validation import validate_records
+from .export.base import ExportSink
+from .utils.retry import backoff_delay
+
+# Marks the end of a stage's input
+_DONE = object()
+
+# Attempts at committing a batch while the database is locked
+WRITE_ATTEMPTS = 5
+WRITE_RETRY_BASE_DELAY = 0.5  # seconds
+
+
+class PipelineError(Exception):
+    """A pipeline stage failed; no further batches are accepted."""
+
+
+class _Batch:
+    """A batch of records from one collector plus its checkpoint state."""
+    
+    __slots__ = ("source", "records", "state")
+    
+    def __init__(self, source: str, records: list, state: Optional[dict]):
+        self.source = source
+        self.records = records
+        self.state = state
+
+
+class _Stage(threading.Thread):
+    """Worker thread that maps batches from one queue to the next."""
+    
+    def __init__(self, name: str, handler: Callable[[_Batch], Optional[_Batch]],
+                 inbox: queue.Queue, outbox: Optional[queue.Queue]):
+        super().__init__(name=f"pipeline-{name}", daemon=True)
+        self.handler = handler
+        self.inbox = inbox
+        self.outbox = outbox
+        self.error: Optional[BaseException] = None
+    
+    def run(self):
+        while True:
+            batch = self.inbox.get()
+            if batch is _DONE:
+                break
+            if self.error is not None:
+                # Keep draining so upstream stages never block on a dead stage
+                continue
+            try:
+                result = self.handler(batch)
+            except Exception as e:
+                logging.getLogger("pipeline").error(f"Stage {self.name} failed: {e}")
+                self.error = e
+                continue
+            if result is not None and self.outbox is not None:
+                self.outbox.put(result)
+        if self.outbox is not None:
+            self.outbox.put(_DONE)
+
+
+class Pipeline:
+    """Validate, dedup, persist and export collector output in background stages."""
+    
+    def __init__(self, db: DatabaseManager, sinks: Sequence[ExportSink] = (), queue_size: int = 4):
+        self.db = db
+        self.sinks = list(sinks)
+        self.logger = logging.getLogger("pipeline")
+        
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.sink_results: Dict[str, Optional[dict]] = {}
+        self._failed_sinks = set()
+        
+        self._seen_ids = set()
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in range(4)]
+        self._stages = [
+            _Stage("validate", self._validate, self._queues[0], self._queues[1]),
+            _Stage("dedup", self._dedup, self._queues[1], self._queues[2]),
+            _Stage("writer", self._write, self._queues[2], self._queues[3]),
+            _Stage("export", self._export, self._queues[3], None),
+        ]
+        for stage in self._stages:
+            stage.start()
+    
+    def run_collector(self, collector, resume_state: Optional[dict] = None,
+                      deadline: Optional[float] = None) -> int:
+        """Run a collector in this thread, streaming its batches into the pipeline."""
+        source = collector.SOURCE_NAME
+        
+        def on_batch(records, state):
+            if self.error is not None:
+                raise PipelineError(f"Pipeline stage failed: {self.error}")
+            self._queues[0].put(_Batch(source, records, state))
+        
+        return collector.run(on_batch=on_batch, resume_state=resume_state, deadline=deadline)
+    
+    @property
+    def error(self) -> Optional[BaseException]:
+        """The first stage failure, if any."""
+        return next((stage.error for stage in self._stages if stage.error is not None), None)
+    
+    def close(self, deadline: Optional[float] = None) -> bool:
+        """
+        Wait for all stages to drain and close the sinks. Raises if a stage failed.
+        
+        With a time.monotonic() deadline, gives up waiting once it passes and
+        returns False; stages that are still running are abandoned (they are
+        daemon threads) and the sinks are not closed.
+        """
+        self._queues[0].put(_DONE)
+        for stage in self._stages:
+            stage.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if stage.is_alive():
+                self.logger.warning(f"Stage {stage.name} still running at the deadline; abandoning it")
+                return False
+        
+        for sink in self.sinks:
+            if sink.name in self._failed_sinks:
+                continue
+            try:
+                self.sink_results[sink.name] = sink.close()
+            except Exception as e:
+                self._sink_failed(sink, e)
+        
+        for stage in self._stages:
+            if stage.error is not None:
+                raise stage.error
+        return True
+    
+    # Stage handlers
+    
+    def _validate(self, batch: _Batch) -> _Batch:
+        valid, errors = validate_records(batch.records)
+        for error in errors:
+            self.invalid += 1
+            self.logger.warning(f"Dropping invalid {batch.source} record: {error}")
+        return _Batch(batch.source, valid, batch.state)
+    
+    def _dedup(self, batch: _Batch) -> _Batch:
+        unique = []
+        for w in batch.records:
+            if w.unique_id in self._seen_ids:
+                self.duplicates += 1
+                continue
+            self._seen_ids.add(w.unique_id)
+            unique.append(w)
+        return _Batch(batch.source, unique, batch.state)
+    
+    def _write(self, batch: _Batch) -> Optional[_Batch]:
+        # Empty batches still carry checkpoint state that must be committed
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                inserted, updated, unchanged = self.db.commit_batch(batch.source, batch.records, batch.state)
+                break
+            except sqlite3.OperationalError as e:
+                if attempt + 1 >= WRITE_ATTEMPTS:
+                    raise
+                delay = backoff_delay(attempt, WRITE_RETRY_BASE_DELAY)
+                self.logger.warning(f"Retrying {batch.source} batch in {delay:.1f}s after: {e}")
+                time.sleep(delay)
+        self.inserted += inserted
+        self.updated += updated
+        self.unchanged += unchanged
+        return batch if batch.records else None
+    
+    def _export(self, batch: _Batch) -> None:
+        for sink in self.sinks:
+            if sink.name in self._failed_sinks:
+                continue
+            try:
+                sink.write(batch.records)
+            except Exception as e:
+                self._sink_failed(sink, e)
+    
+    def _sink_failed(self, sink: ExportSink, error: Exception):
+        """A failing sink is dropped for the rest of the run; the others carry on."""
+        self.logger.error(f"Export sink {sink.name} failed: {error}")
+        self._failed_sinks.add(sink.name)
+        self.sink_results[sink.name] = {"error": str(error)}
@@ -0,0 +1,122 @@
+"""
+On-demand profiling of collector runs (`collect --profile`).
+
+Each collector's run() is wrapped in cProfile and bracketed by tracemalloc
+snapshots; with --trace, Playwright also records a trace of the browser
+context (open it with `playwright show-trace`). Everything goes to one
+directory per run:
+
+    <source>.prof        cProfile stats (pstats, snakeviz, ...)
+    <source>-trace.zip   Playwright trace (--trace only)
+    summary.txt          per collector: where the time went, the hottest
+                         functions and the top allocation sites
+
+The time breakdown splits self time between our own code, Playwright (the
+sync API waiting on the browser: IPC and page loads), sleeping (politeness
+delays and retry backoff) and everything else.
+"""
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator
+
+PROFILE_DIR = "data/profiles"
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+TRACEMALLOC_FRAMES = 10
+
+_SRC = str(Path(__file__).parent)
+# The sync API runs Playwright's asyncio loop in a greenlet; waiting on the browser is spent here
+_PLAYWRIGHT_MARKERS = ("playwright", "greenlet", "asyncio", "selectors")
+
+
+def _category(filename: str, name: str) -> str:
+    if name == "<built-in method time.sleep>":
+        return "sleeping"
+    if any(m in filename or m in name for m in _PLAYWRIGHT_MARKERS) or "method poll" in name:
+        return "playwright"
+    if filename.startswith(_SRC):
+        return "our code"
+    return "other"
+
+
+def time_breakdown(stats: pstats.Stats) -> Dict[str, float]:
+    """Sum self time (seconds) per category."""
+    totals: Dict[str, float] = {}
+    for (filename, _, name), (_, _, tottime, _, _) in stats.stats.items():
+        category = _category(filename, name)
+        totals[category] = totals.get(category, 0.0) + tottime
+    return totals
+
+
+class RunProfiler:
+    """Profiles collector runs and writes the artifacts to a per-run directory."""
+    
+    def __init__(self, root: str = PROFILE_DIR, trace: bool = False):
+        self.dir = Path(root) / datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.trace = trace
+        self.summary_path = self.dir / "summary.txt"
+        self.summary_path.write_text(f"Profile of collect run at {datetime.now().isoformat()}\n")
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    
+    @contextmanager
+    def profile(self, collector) -> Iterator[None]:
+        """Profile everything run inside the block for collector."""
+        source = collector.SOURCE_NAME
+        if self.trace:
+            collector.trace_path = self.dir / f"{source}-trace.zip"
+        
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            wall = time.perf_counter() - started
+            after = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            collector.trace_path = None
+            
+            profiler.dump_stats(str(self.dir / f"{source}.prof"))
+            self._write_summary(source, wall, profiler, before, after, peak)
+    
+    def _write_summary(self, source: str, wall: float, profiler: cProfile.Profile,
+                       before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, peak: int):
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        
+        out.write(f"\n{'=' * 70}\n{source}: {wall:.1f}s wall, peak traced memory {peak / 2**20:.1f} MiB\n")
+        out.write(f"{'=' * 70}\n\nSelf time by category:\n")
+        for category, seconds in sorted(time_breakdown(stats).items(), key=lambda c: -c[1]):
+            out.write(f"  {category:12} {seconds:8.2f}s\n")
+        
+        out.write("\nHottest functions (self time):\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        out.write("\nHottest call paths (cumulative time):\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        
+        out.write("\nTop allocation sites (net growth during the run):\n")
+        ignore = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        )
+        growth = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        for stat in growth[:TOP_ALLOCATIONS]:
+            out.write(f"  {stat}\n")
+        
+        with open(self.summary_path, "a") as f:
+            f.write(out.getvalue())
+    
+    def close(self) -> Path:
+        """Stop tracing allocations. Returns the run's profile directory."""
+        tracemalloc.stop()
+        return self.dir
@@ -0,0 +1,126 @@
+"""
+Re-run the current extractors over the page archive.
+
+The latest snapshot of every archived page is spread over worker processes.
+Each worker runs its own headless Chromium with JavaScript disabled and all
+network requests blocked, loads each snapshot at its original URL and calls
+the collector's extract_archived(). The results are joined per collector
+(records_from_archive()) and written to the database like a normal run,
+except for webinars that have expired into webinars_archive.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional
+
+from playwright.sync_api import sync_playwright
+
+from .archive import ArchivedPage, PageArchive
+from .collectors import PaveCollector, SyndioCollector, WorldatWorkCollector
+from .database.db_manager import DatabaseManager
+from .database.validation import validate_records
+
+COLLECTORS = {
+    c.SOURCE_NAME: c for c in (SyndioCollector, WorldatWorkCollector, PaveCollector)
+}
+
+logger = logging.getLogger("reparse")
+
+
+def _extract_chunk(archive_root: str, chunk: List[tuple]) -> List[tuple]:
+    """Worker: extract (index, page) snapshots. Returns (index, source, kind, url, result) tuples."""
+    archive = PageArchive(archive_root)
+    collectors = {}
+    results = []
+    html = {"body": ""}
+    
+    def serve(route):
+        if route.request.is_navigation_request():
+            route.fulfill(body=html["body"], content_type="text/html; charset=utf-8")
+        else:
+            route.abort()
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context(java_script_enabled=False)
+        context.route("**/*", serve)
+        page = context.new_page()
+        
+        for index, snapshot in chunk:
+            collector = collectors.get(snapshot.source)
+            if collector is None:
+                collector = collectors[snapshot.source] = COLLECTORS[snapshot.source]()
+            try:
+                html["body"] = archive.read(snapshot)
+                # Via about:blank so URLs differing only in the fragment still load
+                page.goto("about:blank")
+                page.goto(snapshot.url, wait_until="domcontentloaded")
+                result = collector.extract_archived(page, snapshot.kind)
+            except Exception as e:
+                logger.warning(f"Could not reparse {snapshot.url}: {e}")
+                continue
+            results.append((index, snapshot.source, snapshot.kind, snapshot.url, result))
+        
+        browser.close()
+    return results
+
+
+def reparse(db: DatabaseManager, archive: PageArchive, source: Optional[str] = None,
+            workers: Optional[int] = None) -> Dict[str, dict]:
+    """
+    Re-extract the archived pages and upsert the resulting records.
+    
+    Args:
+        db: Database to write to
+        archive: Page archive to read
+        source: Only reparse this collector's pages
+        workers: Worker processes (default: one per CPU core)
+    
+    Returns:
+        Per-source dict with pages, records, inserted, updated, unchanged,
+        invalid and archived (records skipped because they have expired)
+    """
+    snapshots: List[ArchivedPage] = [
+        s for s in archive.latest(source) if s.source in COLLECTORS
+    ]
+    if not snapshots:
+        return {}
+    
+    workers = max(1, min(workers or os.cpu_count() or 1, len(snapshots)))
+    indexed = list(enumerate(snapshots))
+    chunks = [indexed[i::workers] for i in range(workers)]
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_results in pool.map(_extract_chunk, repeat(str(archive.root)), chunks):
+            results.extend(chunk_results)
+    # Back in archive order, so listings keep their page order
+    results.sort(key=lambda r: r[0])
+    
+    # Old snapshots still show expired webinars; they stay archived
+    archived_ids = db.get_archived_ids()
+    summary = {}
+    for name, collector_cls in COLLECTORS.items():
+        source_results = [(kind, url, value) for _, src, kind, url, value in results if src == name]
+        if not source_results:
+            continue
+        records = {}
+        skipped = 0
+        for record in collector_cls().records_from_archive(source_results):
+            if record.unique_id in archived_ids:
+                skipped += 1
+                continue
+            records.setdefault(record.unique_id, record)
+        valid, errors = validate_records(list(records.values()))
+        inserted, updated, unchanged = db.bulk_upsert(valid)
+        summary[name] = {
+            "pages": sum(1 for s in snapshots if s.source == name),
+            "records": len(records),
+            "inserted": inserted,
+            "updated": updated,
+            "unchanged": unchanged,
+            "invalid": len(errors),
+            "archived": skipped,
+        }
+    return summary
@@ -0,0 +1,166 @@
+"""
+Read-only HTTP query service over the webinar DB (stdlib only).
+
+    GET /webinars?source=Pave&from=2025-01-01&to=2025-12-31&q=equity&limit=50&after=120
+    GET /stats
+    GET /health
+
+/webinars returns {"items": [...], "next": <after value for the next page or null>}
+in id order; pass "next" back as after= for the next page (keyset pagination,
+so deep pages cost the same as the first). /stats returns provider_stats.
+
+Every response carries an ETag derived from the DB's data version (the last
+change log seq and last crawl); a request with a matching If-None-Match gets
+304 without touching the results. Responses are kept in an in-process LRU
+cache keyed by path and query, and the cache is dropped as soon as the data
+version moves (a collect, merge or prune wrote to the DB).
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from .database.db_manager import DatabaseManager
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+CACHE_SIZE = 256
+
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+logger = logging.getLogger("service")
+
+
+class BadRequest(ValueError):
+    """A query parameter is missing or malformed."""
+
+
+class ResponseCache:
+    """LRU of encoded responses, emptied whenever the data version changes."""
+    
+    def __init__(self, size: int = CACHE_SIZE):
+        self.size = size
+        self.version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, version: str) -> Optional[bytes]:
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+    
+    def put(self, key: str, version: str, body: bytes):
+        with self._lock:
+            if version != self.version:
+                # Written while this response was being built; it may already be stale
+                return
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+class QueryService:
+    """Answers queries against the DB, with ETags and a response cache."""
+    
+    def __init__(self, db: DatabaseManager, cache_size: int = CACHE_SIZE):
+        self.db = db
+        self.cache = ResponseCache(cache_size)
+    
+    def handle(self, path: str, query: Dict[str, str], if_none_match: Optional[str] = None) -> Tuple[int, str, bytes]:
+        """
+        Answer a GET request.
+        
+        Returns (status, etag, body); body is empty for 304.
+        """
+        if path == "/health":
+            return 200, "", b'{"status": "ok"}'
+        if path not in ("/webinars", "/stats"):
+            return 404, "", json.dumps({"error": f"Unknown path {path}"}).encode()
+        
+        version = self.db.data_version()
+        key = f"{path}?{urlencode(sorted(query.items()))}"
+        etag = f'"{hashlib.sha1(f"{version}|{key}".encode()).hexdigest()[:20]}"'
+        if if_none_match and etag in (t.strip() for t in if_none_match.split(",")):
+            return 304, etag, b""
+        
+        body = self.cache.get(key, version)
+        if body is None:
+            try:
+                result = self._webinars(query) if path == "/webinars" else {"providers": self.db.get_source_counts()}
+            except BadRequest as e:
+                return 400, "", json.dumps({"error": str(e)}).encode()
+            body = json.dumps(result, ensure_ascii=False).encode("utf-8")
+            self.cache.put(key, version, body)
+        return 200, etag, body
+    
+    def _webinars(self, query: Dict[str, str]) -> dict:
+        for name in ("from", "to"):
+            if query.get(name) and not _DATE.match(query[name]):
+                raise BadRequest(f"{name} must be YYYY-MM-DD")
+        try:
+            limit = min(int(query.get("limit", DEFAULT_LIMIT)), MAX_LIMIT)
+            after = int(query.get("after", 0))
+        except ValueError:
+            raise BadRequest("limit and after must be integers")
+        if limit < 1:
+            raise BadRequest("limit must be at least 1")
+        
+        items = self.db.query_webinars(
+            source=query.get("source"), date_from=query.get("from"), date_to=query.get("to"),
+            text=query.get("q"), after=after, limit=limit,
+        )
+        return {"items": items, "next": items[-1]["id"] if len(items) == limit else None}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so pollers reuse their connection
+    protocol_version = "HTTP/1.1"
+    service: QueryService
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            status, etag, body = self.service.handle(url.path, query, self.headers.get("If-None-Match"))
+        except Exception as e:
+            logger.error(f"Request {self.path} failed: {e}")
+            status, etag, body = 500, "", b'{"error": "internal error"}'
+        
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+def make_server(db: DatabaseManager, host: str = "127.0.0.1", port: int = 8000,
+                cache_size: int = CACHE_SIZE) -> ThreadingHTTPServer:
+    """Create the HTTP server (one thread per connection); call serve_forever() on it."""
+    handler = type("Handler", (_Handler,), {"service": QueryService(db, cache_size)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
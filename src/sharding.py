@@ -0,0 +1,75 @@
+"""
+Sharded collection across several runners, and merging the shard DBs.
+
+`collect --shard i/n` (1 <= i <= n) runs the part of the work shard i owns:
+- providers are assigned whole to one shard by a stable hash of their name,
+  except collectors with SHARD_BY_ITEM, which run on every shard and split
+  their per-item work (WorldatWork detail pages) by a hash of the URL
+- each shard writes to its own DB and records which shard it was
+
+`merge` combines the shard DBs into one. Webinars conflict on unique_id and
+the newer last_updated wins if the content differs (ties keep the row
+already merged); each webinar a merge inserts or changes gets one change log
+entry; each shard's retry queue replaces the entries it owns. Shards are merged in path order,
+so the result does not depend on the order they finished in. Run state, the
+sitemap index and learned extraction strategies are shard-local and are not
+merged.
+"""
+import hashlib
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Set
+
+from .database.db_manager import DatabaseManager
+
+
+class Shard(NamedTuple):
+    """Shard index (1-based) out of count."""
+    
+    index: int
+    count: int
+    
+    def owns(self, key: str) -> bool:
+        """Whether this shard is responsible for key (a provider name or URL)."""
+        digest = hashlib.sha1(key.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
+    
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse "i/n" into a Shard; raises ValueError if malformed."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/n, got {value!r}")
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}, got {index}")
+    return Shard(index, count)
+
+
+def _owns_failure(shard: Shard, item_sources: Set[str], source: str, url: str) -> bool:
+    """Whether shard owns a retry queue entry (by URL for SHARD_BY_ITEM sources)."""
+    return shard.owns(url if source in item_sources else source)
+
+
+def merge_shards(db: DatabaseManager, shard_paths: Iterable[str]) -> List[Dict]:
+    """
+    Merge shard DBs into db, in path order.
+    
+    Returns one result dict per shard (path, webinars, changes).
+    """
+    results = []
+    for path in sorted(str(Path(p)) for p in shard_paths):
+        if Path(path).resolve() == db.db_path.resolve():
+            raise ValueError(f"Cannot merge {path} into itself")
+        info = DatabaseManager(path).get_shard_info()
+        owner = None
+        if info:
+            shard = Shard(info["index"], info["count"])
+            owner = partial(_owns_failure, shard, set(info.get("item_sources", [])))
+        
+        counts = db.merge_shard(path, owns_failure=owner)
+        results.append({"path": path, **counts})
+    return results
@@ -1,3 +1,10 @@
-from .logger import setup_logger
+from .logger import PER_ITEM, setup_logger, setup_logging
+from .politeness import HostPolicy, PolitenessScheduler, get_scheduler
+from .dates import AIRED, AVAILABLE_UNTIL, extract_date, find_dates
+from .retry import CircuitOpen, Disallowed, FetchError, is_transient
 
-__all__ = ["setup_logger"]
+__all__ = [
+    "setup_logger", "setup_logging", "PER_ITEM", "HostPolicy", "PolitenessScheduler", "get_scheduler",
+    "AIRED", "AVAILABLE_UNTIL", "extract_date", "find_dates",
+    "CircuitOpen", "Disallowed", "FetchError", "is_transient",
+]
@@ -0,0 +1,89 @@
+"""
+Persistent browser profile management.
+
+Opt-in via BROWSER_PROFILE_DIR: each collector then launches Chromium with
+its own persistent user-data dir under it, so the HTTP cache (JS bundles,
+CSS, fonts) survives between runs. The directory can be cached as a CI
+artifact.
+
+Each profile is capped at BROWSER_PROFILE_MAX_MB (default 200). Chromium
+enforces it on its HTTP cache itself (--disk-cache-size, see
+chromium_args()). As a backstop, a profile still over the cap after a run
+loses whole cache directories; single files are never deleted, since that
+would leave the cache index pointing at missing entries. Cookies and other
+profile state are never pruned.
+"""
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_MAX_MB = 200
+
+# Chromium profile sub-directories that only hold re-downloadable cache data
+CACHE_DIRS = (
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "Default/Service Worker/CacheStorage",
+    "Default/Service Worker/ScriptCache",
+)
+
+logger = logging.getLogger("browser_profile")
+
+
+def get_profile_dir(name: str) -> Optional[Path]:
+    """Get the persistent profile dir for a collector, or None if not enabled."""
+    root = os.environ.get("BROWSER_PROFILE_DIR")
+    if not root:
+        return None
+    path = Path(root) / name.lower()
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_max_bytes() -> int:
+    return int(os.environ.get("BROWSER_PROFILE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024
+
+
+def chromium_args(max_bytes: Optional[int] = None) -> List[str]:
+    """Launch arguments that make Chromium keep its disk cache under the cap."""
+    max_bytes = get_max_bytes() if max_bytes is None else max_bytes
+    return [f"--disk-cache-size={max_bytes}"]
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for file in path.rglob("*"):
+        try:
+            if file.is_file():
+                total += file.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def enforce_size_cap(profile_dir: Path, max_bytes: Optional[int] = None) -> int:
+    """
+    Delete whole cache directories until the profile is under the cap.
+    
+    Must be called while no browser is using the profile.
+    Returns the number of bytes freed.
+    """
+    max_bytes = get_max_bytes() if max_bytes is None else max_bytes
+    size = _dir_size(profile_dir)
+    if size <= max_bytes:
+        return 0
+    
+    # Largest first, so as little of the cache as possible is lost
+    cache_dirs = [profile_dir / sub for sub in CACHE_DIRS if (profile_dir / sub).is_dir()]
+    freed = 0
+    for cache_dir, dir_size in sorted(((d, _dir_size(d)) for d in cache_dirs), key=lambda c: -c[1]):
+        if size - freed <= max_bytes:
+            break
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        freed += dir_size
+    
+    logger.info(f"Pruned {freed / 1024 / 1024:.1f} MB of cache from {profile_dir}")
+    return freed
@@ -0,0 +1,182 @@
+"""
+Shared date extraction for collector text parsing.
+
+All supported formats and labels are compiled into one pattern, so a
+single pass over a card or page finds every date and tells which label
+(if any) introduced it:
+
+- "Aired on: November 20, 2025"      (label AIRED)
+- "On Demand until Dec 31 2025"      (label AVAILABLE_UNTIL)
+- "20 November 2025", "2025-11-20", "11/20/2025"
+
+Whitespace (including newlines between the parts of a date, as on Pave's
+cards) is tolerated. Dates are returned as "Month D, YYYY"; impossible
+dates such as "Feb 31" are skipped.
+"""
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Iterator, List, NamedTuple, Optional
+
+AIRED = "aired"
+AVAILABLE_UNTIL = "until"
+
+MONTH_NAMES = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]
+_MONTH_NUMBERS = {name[:3].lower(): i for i, name in enumerate(MONTH_NAMES, 1)}
+
+_MONTH = (
+    r"(?i:(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?"
+    r"|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\b\.?)"
+)
+_DAY = r"(\d{1,2})(?i:st|nd|rd|th)?"
+
+# 12 groups: month-first (m, d, y), day-first (d, m, y), ISO (y, m, d), US numeric (m, d, y)
+_DATE = (
+    rf"(?:{_MONTH}\s*{_DAY}\s*,?\s*(\d{{4}})\b"
+    rf"|{_DAY}\s+{_MONTH},?\s+(\d{{4}})\b"
+    r"|(\d{4})-(\d{2})-(\d{2})\b"
+    r"|(\d{1,2})/(\d{1,2})/(\d{4})\b)"
+)
+_DATE_GROUPS = 12
+
+_LABELS = {
+    AIRED: r"Aired\s+on\b:?",
+    AVAILABLE_UNTIL: r"On\s+Demand\s+until\b:?",
+}
+
+# Every label and format in one pattern: group 1 is the label, 2-13 the
+# labelled date, 14-25 an unlabelled date. Each branch starts with a
+# letter or digit, which keeps the scan from backtracking at every position.
+_LABEL = "|".join(_LABELS.values())
+_PATTERN = re.compile(rf"({_LABEL})\s*{_DATE}|(?<!\w){_DATE}")
+
+# Labels are matched case-sensitively (as the sites print them) so these
+# single-label patterns start with a literal the regex engine can skip to
+_LABEL_PATTERNS = {
+    label: re.compile(rf"({pattern})\s*{_DATE}")
+    for label, pattern in _LABELS.items()
+}
+
+
+class DateMatch(NamedTuple):
+    """A date found in text."""
+    
+    label: Optional[str]
+    value: str
+    start: int
+
+
+# The last group of each date branch tells the branch apart; it maps to that
+# branch's (month, day, year) groups. Keyed by the group the date groups start
+# after: 1 behind a label, 1 + _DATE_GROUPS for an unlabelled date in _PATTERN.
+_BRANCH_GROUPS = {
+    offset: {
+        offset + last: tuple(offset + g for g in groups)
+        for last, groups in {3: (1, 2, 3), 6: (5, 4, 6), 9: (8, 9, 7), 12: (10, 11, 12)}.items()
+    }
+    for offset in (1, 1 + _DATE_GROUPS)
+}
+
+# Every date ends in a 4-digit year and spans fewer characters than this up
+# to it, so an unlabelled scan can start this far before the next year
+_YEAR = re.compile(r"\d{4}")
+_MAX_SPAN = 64
+
+# Fast path for the commonest unlabelled form, a capitalised month name
+# first: the pattern starts with a set of literals the engine can skip to.
+# It is only the first date if no digit (which every date has) comes before it.
+_CAPITALISED_MONTH = (
+    r"(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?"
+    r"|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\b\.?"
+)
+_MONTH_FIRST = re.compile(rf"{_CAPITALISED_MONTH}\s*{_DAY}\s*,?\s*(\d{{4}})\b")
+_DIGIT = re.compile(r"\d")
+
+
+@lru_cache(maxsize=4096)
+def _format(month: str, day: str, year: str) -> Optional[str]:
+    """Format matched month (name or number), day and year; None if no such date."""
+    number = int(month) if month.isdigit() else _MONTH_NUMBERS[month[:3].lower()]
+    try:
+        value = date(int(year), number, int(day))
+    except ValueError:
+        return None
+    return f"{MONTH_NAMES[value.month - 1]} {value.day}, {value.year}"
+
+
+def _to_date(match: "re.Match", offset: int) -> Optional[str]:
+    """Format the date whose 12 groups start after group offset."""
+    return _format(*match.group(*_BRANCH_GROUPS[offset][match.lastindex]))
+
+
+def _label_of(text: str) -> str:
+    return AIRED if text[:1].lower() == "a" else AVAILABLE_UNTIL
+
+
+def iter_dates(text: str) -> Iterator[DateMatch]:
+    """Scan text once, yielding each date with the label that introduced it."""
+    text = text or ""
+    pos = 0
+    while True:
+        # Skip straight to the neighbourhood of the next year instead of
+        # trying the full pattern at every position
+        year = _YEAR.search(text, pos)
+        if year is None:
+            return
+        match = _PATTERN.search(text, max(pos, year.start() - _MAX_SPAN))
+        if match is None:
+            return
+        pos = match.end()
+        if match.group(1):
+            label, value = _label_of(match.group(1)), _to_date(match, 1)
+        else:
+            label, value = None, _to_date(match, 1 + _DATE_GROUPS)
+        if value is not None:
+            yield DateMatch(label, value, match.start())
+
+
+def _first_date(text: str) -> Optional[str]:
+    """Get the first date of any kind in text."""
+    match = _MONTH_FIRST.search(text)
+    if match is not None:
+        start = match.start()
+        if not (start and text[start - 1].isalnum()) and _DIGIT.search(text, 0, start) is None:
+            value = _format(*match.groups())
+            if value is not None:
+                return value
+    return next((match.value for match in iter_dates(text)), None)
+
+
+def find_dates(text: str) -> List[DateMatch]:
+    """Find every date in text."""
+    return list(iter_dates(text))
+
+
+def extract_date(text: str, label: Optional[str] = None, fallback: bool = False) -> Optional[str]:
+    """
+    Get the first date in text introduced by label.
+    
+    Args:
+        text: Card or page text
+        label: AIRED, AVAILABLE_UNTIL, or None for the first date of any kind
+        fallback: If no date with that label is found, return the first date of any kind
+    
+    Returns:
+        Date as "Month D, YYYY", or None
+    """
+    text = text or ""
+    if label is not None:
+        pattern = _LABEL_PATTERNS[label]
+        match = pattern.search(text)
+        while match is not None:
+            value = _to_date(match, 1)
+            if value is not None:
+                return value
+            match = pattern.search(text, match.end())
+        if not fallback:
+            return None
+    
+    return _first_date(text)
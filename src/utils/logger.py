@@ -1,54 +1,162 @@
 """
-Logging utility for the webinar scraper.
+Logging setup for the webinar scraper.
+
+All loggers propagate to the root logger, whose only handler is a
+QueueHandler: a log call just puts the record on an unbounded queue and
+returns, and a QueueListener thread formats and writes it. Scraping threads
+never wait on console or file I/O.
+
+Every record carries the run ID (RUN_ID, else GITHUB_RUN_ID, else a random
+one). Output is one JSON object per line (LOG_FORMAT=text for the plain
+format); LOG_FILE also writes JSON lines to a file.
+
+Per-item lines (logged with extra=PER_ITEM) are sampled: only every
+LOG_ITEM_SAMPLE-th one of each logger is kept (default 10; 1 keeps all).
+Warnings and errors are never sampled.
 """
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from datetime import datetime
-from pathlib import Path
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Pass as extra= on per-item log lines (one per card or detail page) so they are sampled
+PER_ITEM = {"per_item": True}
+
+DEFAULT_ITEM_SAMPLE = 10
+
+# Attributes every LogRecord has; anything else came from extra=
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "run_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_lock = threading.Lock()
+run_id: Optional[str] = None
+
+
+class RunIdFilter(logging.Filter):
+    """Stamps records with the run ID."""
+    
+    def __init__(self, run_id: str):
+        super().__init__()
+        self.run_id = run_id
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = self.run_id
+        return True
+
+
+class ItemSampler(logging.Filter):
+    """Keeps every n-th per-item record of each logger (first one included)."""
+    
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._counts: Dict[str, int] = {}
+        # Collectors log from several threads
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "per_item", False) or record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            count = self._counts.get(record.name, 0)
+            self._counts[record.name] = count + 1
+        return count % self.every == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, including extra= fields."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "run_id": getattr(record, "run_id", None),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in entry:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def setup_logging(run: Optional[str] = None, log_file: Optional[str] = None,
+                  level: int = logging.INFO) -> str:
+    """
+    Route all logging through a queue to a background writer thread.
+    
+    Safe to call more than once; later calls keep the first setup.
+    Returns the run ID.
+    """
+    global _listener, run_id
+    with _lock:
+        if _listener is not None:
+            return run_id
+        run_id = run or os.environ.get("RUN_ID") or os.environ.get("GITHUB_RUN_ID") or uuid.uuid4().hex[:12]
+        
+        if os.environ.get("LOG_FORMAT", "json") == "text":
+            formatter = logging.Formatter("%(asctime)s | %(levelname)-8s | %(run_id)s | %(name)s | %(message)s")
+        else:
+            formatter = JsonFormatter()
+        console = logging.StreamHandler(sys.stderr)
+        console.setFormatter(formatter)
+        handlers = [console]
+        log_file = log_file or os.environ.get("LOG_FILE")
+        if log_file:
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+        
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(RunIdFilter(run_id))
+        queue_handler.addFilter(ItemSampler(int(os.environ.get("LOG_ITEM_SAMPLE", DEFAULT_ITEM_SAMPLE))))
+        
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+        return run_id
+
+
+def stop_logging():
+    """Flush the queue and stop the writer thread."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
 
 
 def setup_logger(name: str = "webinar_scraper", log_file: bool = True) -> logging.Logger:
     """
-    Configure and return a logger instance.
+    Get a logger that writes through the queued setup.
     
     Args:
         name: Logger name
-        log_file: Whether to also log to a file
+        log_file: Whether to also log to a file (logs/scraper_YYYYMMDD.log unless LOG_FILE is set)
     
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    
-    # Only configure if not already configured
-    if logger.handlers:
-        return logger
-    
-    logger.setLevel(logging.DEBUG)
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
-    
-    # File handler (optional)
-    if log_file:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        log_filename = f"scraper_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_dir / log_filename)
-        file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
-    
-    return logger
+    path = None
+    if log_file and not os.environ.get("LOG_FILE"):
+        os.makedirs("logs", exist_ok=True)
+        path = os.path.join("logs", f"scraper_{datetime.now().strftime('%Y%m%d')}.log")
+    setup_logging(log_file=path)
+    return logging.getLogger(name)
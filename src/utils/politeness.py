@@ -0,0 +1,247 @@
+"""
+Per-host politeness scheduler.
+
+Every page navigation and HTTP request made by a collector goes through a
+single scheduler, which enforces for each host:
+- a maximum number of in-flight requests
+- a minimum spacing between request starts
+- the robots.txt Crawl-delay (read from a cached local copy)
+
+URLs the cached robots.txt disallows are refused with Disallowed.
+
+Limits adapt to how the host is behaving: errors or slow responses halve the
+concurrency and double the spacing, fast responses slowly win them back.
+
+Each host also has a circuit breaker: after failure_threshold consecutive
+failures, requests to it fail fast with CircuitOpen for circuit_cooldown
+seconds, after which a single trial request decides whether it closes again.
+"""
+import logging
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from .retry import TRANSIENT_STATUSES, CircuitOpen, Disallowed, FetchError
+
+
+USER_AGENT = "WebinarScraper"
+
+
+@dataclass
+class HostPolicy:
+    """Static politeness limits for a host."""
+    
+    max_in_flight: int = 2
+    min_interval: float = 1.0
+    max_interval: float = 30.0
+    slow_threshold: float = 10.0
+    fast_threshold: float = 2.0
+    failure_threshold: int = 5
+    circuit_cooldown: float = 120.0
+
+
+DEFAULT_POLICY = HostPolicy()
+
+HOST_POLICIES: Dict[str, HostPolicy] = {
+    "synd.io": HostPolicy(max_in_flight=4, min_interval=0.5),
+    "pave.com": HostPolicy(max_in_flight=4, min_interval=0.5),
+    "explore.pave.com": HostPolicy(max_in_flight=4, min_interval=0.5),
+    "worldatwork.org": HostPolicy(max_in_flight=2, min_interval=1.0),
+}
+
+
+def normalize_host(url: str) -> str:
+    """Get the policy key for a URL (lowercase host without a leading www.)."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class _HostState:
+    """Mutable, adaptive state for one host."""
+    
+    def __init__(self, policy: HostPolicy, robots: Optional[RobotFileParser]):
+        self.policy = policy
+        self.robots = robots
+        crawl_delay = robots.crawl_delay(USER_AGENT) if robots else None
+        self.base_interval = max(policy.min_interval, float(crawl_delay or 0.0))
+        self.interval = self.base_interval
+        self.limit = policy.max_in_flight
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.failures = 0
+        self.open_until = 0.0
+        self.trial_in_flight = False
+        self.cond = threading.Condition()
+
+
+class PolitenessScheduler:
+    """Shared gate for all requests, keyed by host."""
+    
+    def __init__(self, robots_dir: str = "data/robots", robots_max_age: float = 86400.0,
+                 policies: Optional[Dict[str, HostPolicy]] = None):
+        self.robots_dir = Path(robots_dir)
+        self.robots_max_age = robots_max_age
+        self.policies = dict(HOST_POLICIES if policies is None else policies)
+        self.logger = logging.getLogger("politeness")
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+    
+    def _check_circuit(self, url: str, state: _HostState) -> bool:
+        """Raise CircuitOpen if the host is failing. Returns True for a half-open trial request."""
+        if state.failures < state.policy.failure_threshold:
+            return False
+        retry_in = state.open_until - time.monotonic()
+        if retry_in > 0 or state.trial_in_flight:
+            raise CircuitOpen(normalize_host(url), max(retry_in, 0.0))
+        state.trial_in_flight = True
+        return True
+    
+    def _state(self, url: str) -> _HostState:
+        host = normalize_host(url)
+        with self._lock:
+            state = self._hosts.get(host)
+        if state is not None:
+            return state
+        
+        # robots.txt may come over the network; don't hold up other hosts meanwhile
+        robots = self._robots(url)
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                policy = self.policies.get(host, DEFAULT_POLICY)
+                state = _HostState(policy, robots)
+                self._hosts[host] = state
+            return state
+    
+    def _robots(self, url: str) -> Optional[RobotFileParser]:
+        """Get the parsed robots.txt for a URL's host, using the local cache."""
+        parsed = urlparse(url)
+        if not parsed.hostname:
+            return None
+        
+        cache_file = self.robots_dir / f"{parsed.hostname}.txt"
+        fresh = cache_file.exists() and time.time() - cache_file.stat().st_mtime < self.robots_max_age
+        
+        if not fresh:
+            robots_url = f"{parsed.scheme or 'https'}://{parsed.netloc}/robots.txt"
+            try:
+                request = urllib.request.Request(robots_url, headers={"User-Agent": USER_AGENT})
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    body = response.read().decode("utf-8", errors="replace")
+                self.robots_dir.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(body, encoding="utf-8")
+            except Exception as e:
+                self.logger.debug(f"Could not fetch {robots_url}: {e}")
+        
+        if not cache_file.exists():
+            return None
+        
+        parser = RobotFileParser()
+        parser.parse(cache_file.read_text(encoding="utf-8").splitlines())
+        return parser
+    
+    def sitemaps_for(self, url: str) -> List[str]:
+        """Get the Sitemap URLs listed in a host's robots.txt."""
+        parser = self._robots(url)
+        return list((parser.site_maps() if parser else None) or [])
+    
+    def limit_for(self, url: str) -> int:
+        """Current in-flight limit for a URL's host (for callers that batch requests themselves)."""
+        return self._state(url).limit
+    
+    @contextmanager
+    def slot(self, url: str):
+        """
+        Hold a request slot for url; timing and errors feed the adaptive limits.
+        
+        Raises Disallowed, without taking a slot, if robots.txt disallows url.
+        """
+        state = self._state(url)
+        if state.robots is not None and not state.robots.can_fetch(USER_AGENT, url):
+            raise Disallowed(url)
+        
+        with state.cond:
+            trial = self._check_circuit(url, state)
+            while True:
+                now = time.monotonic()
+                if state.in_flight < state.limit and now >= state.next_start:
+                    break
+                wait = state.next_start - now if state.in_flight < state.limit else None
+                state.cond.wait(timeout=wait)
+            state.in_flight += 1
+            state.next_start = now + state.interval
+        
+        started = time.monotonic()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._release(state, time.monotonic() - started, failed, trial)
+    
+    def _release(self, state: _HostState, elapsed: float, failed: bool, trial: bool = False):
+        policy = state.policy
+        with state.cond:
+            state.in_flight -= 1
+            if trial:
+                state.trial_in_flight = False
+            if failed:
+                state.failures += 1
+                if state.failures >= policy.failure_threshold:
+                    state.open_until = time.monotonic() + policy.circuit_cooldown
+            else:
+                state.failures = 0
+            if failed or elapsed > policy.slow_threshold:
+                # Back off: halve concurrency, double spacing
+                state.limit = max(1, state.limit // 2)
+                state.interval = min(policy.max_interval, max(state.interval, 0.1) * 2)
+            elif elapsed < policy.fast_threshold:
+                # Recover gradually towards the static policy
+                state.limit = min(policy.max_in_flight, state.limit + 1)
+                state.interval = max(state.base_interval, state.interval * 0.9)
+            state.cond.notify_all()
+    
+    def goto(self, page, url: str, **kwargs):
+        """
+        Navigate a Playwright page through the scheduler.
+        
+        429 and 5xx responses raise FetchError so they count as host failures;
+        other statuses (including 404) are returned for the caller to handle.
+        """
+        with self.slot(url):
+            response = page.goto(url, **kwargs)
+            if response is not None and response.status in TRANSIENT_STATUSES:
+                raise FetchError(url, response.status)
+            return response
+    
+    def request(self, method: str, url: str, **kwargs):
+        """Make an HTTP request (via requests) through the scheduler."""
+        import requests
+        
+        kwargs.setdefault("timeout", 30)
+        with self.slot(url):
+            response = requests.request(method, url, **kwargs)
+            if response.status_code in TRANSIENT_STATUSES or response.status_code >= 500:
+                response.raise_for_status()
+            return response
+
+
+_default_scheduler: Optional[PolitenessScheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler() -> PolitenessScheduler:
+    """Get the process-wide scheduler shared by all collectors."""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = PolitenessScheduler()
+        return _default_scheduler
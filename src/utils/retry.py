@@ -0,0 +1,75 @@
+"""
+Failure classification and backoff for page navigation.
+
+Navigation failures are either transient (timeouts, dropped connections,
+429 and 5xx responses) and worth retrying, or permanent (404, 410, other
+4xx, malformed URLs) and not. Transient failures that still fail after the
+retries go into the DB's retry queue for the next run.
+"""
+import random
+from typing import Optional
+
+# HTTP statuses worth retrying
+TRANSIENT_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Chromium network errors that will not go away on a retry
+_PERMANENT_NET_ERRORS = (
+    "net::ERR_INVALID_URL",
+    "net::ERR_UNKNOWN_URL_SCHEME",
+    "net::ERR_BLOCKED_BY_CLIENT",
+    "net::ERR_BLOCKED_BY_RESPONSE",
+)
+
+
+class FetchError(Exception):
+    """A navigation that returned an error status."""
+    
+    def __init__(self, url: str, status: Optional[int] = None, message: str = ""):
+        self.url = url
+        self.status = status
+        super().__init__(message or f"HTTP {status} for {url}")
+    
+    @property
+    def transient(self) -> bool:
+        return self.status is None or self.status in TRANSIENT_STATUSES
+
+
+class Disallowed(FetchError):
+    """Raised instead of fetching a URL the host's robots.txt disallows."""
+    
+    def __init__(self, url: str):
+        super().__init__(url, message=f"robots.txt disallows {url}")
+    
+    @property
+    def transient(self) -> bool:
+        return False
+
+
+class CircuitOpen(Exception):
+    """Raised instead of navigating while a host's circuit breaker is open."""
+    
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {host} (retry in {retry_in:.0f}s)")
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether retrying the navigation that raised error could succeed."""
+    if isinstance(error, FetchError):
+        return error.transient
+    if isinstance(error, CircuitOpen):
+        # Retried on the next run, not now
+        return False
+    # Playwright's TimeoutError does not subclass the builtin one
+    if isinstance(error, (TimeoutError, ConnectionError)) or type(error).__name__ == "TimeoutError":
+        return True
+    message = str(error)
+    if "net::ERR_" in message:
+        return not any(code in message for code in _PERMANENT_NET_ERRORS)
+    return False
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -1,30 +1,7 @@
-"""Quick script to view the database contents."""
-import sqlite3
+"""Quick script to view the database contents (same as `python src/main.py report`)."""
+import sys
 
-conn = sqlite3.connect('data/webinars.db')
-cursor = conn.cursor()
+from src.main import main
 
-print("=" * 80)
-print("WEBINAR DATABASE CONTENTS")
-print("=" * 80)
-
-cursor.execute("SELECT COUNT(*) FROM webinars")
-total = cursor.fetchone()[0]
-print(f"Total webinars: {total}")
-print()
-
-cursor.execute("""
-    SELECT provider, webinar_type, title, detail_link 
-    FROM webinars 
-    ORDER BY provider, title
-""")
-
-rows = cursor.fetchall()
-
-print(f"{'PROVIDER':12} | {'TYPE':10} | TITLE")
-print("-" * 80)
-
-for provider, wtype, title, link in rows:
-    print(f"{provider:12} | {wtype:10} | {title[:50]}")
-
-conn.close()
+if __name__ == "__main__":
+    sys.exit(main(["report"] + sys.argv[1:]))